@@ -1,30 +1,30 @@
-import importlib
+import sys
 from pathlib import Path
 from typing import Optional, List, Annotated
 
 import typer
 
-from pyscript.commands.add import add_script
-from pyscript.commands.clean import clean_environment
-from pyscript.commands.download import download_scripts
-from pyscript.commands.list import list_scripts
-from pyscript.commands.remove import remove_script
-from pyscript.commands.run import run_script
-from pyscript.commands.update import update_script
-from pyscript.core.manager import init
-from pyscript.utils.console import Console
-
 
+# Command handlers are imported inside each command, so only the module of the invoked one is loaded
 app = typer.Typer(help="🐍 pyscript — Simple modular Python script runner")
 
 
 def version_callback(value: bool):
     if value:
-        v = importlib.metadata.version("pyscript")
-        print(f"pyscript {str(v)}")
+        from pyscript import __version__
+        sys.stdout.write(f"pyscript {__version__}\n")
         raise typer.Exit()
 
 
+def _console():
+    """
+    Returns the Console wrapper class, importing Rich only when some output has to be printed.
+    """
+
+    from pyscript.utils.console import Console
+    return Console
+
+
 @app.callback()
 def main(
         version: Annotated[
@@ -36,6 +36,11 @@ def main(
             )
         ] = None
 ):
+    # Showing the help of a command doesn't need the environment
+    if "--help" in sys.argv[1:]:
+        return
+
+    from pyscript.core.manager import init
     init()
 
 
@@ -45,21 +50,25 @@ def list_commands():
     List all available commands.
     """
 
+    from pyscript.commands.list import list_scripts
     list_scripts()
-    Console.print()
+    _console().print()
 
 
 @app.command()
 def run(
         script_name: str = typer.Argument(..., help="Script name"),
-        args: str = typer.Argument(None, help="Optional argument for the script")
+        args: str = typer.Argument(None, help="Optional argument for the script"),
+        allow_host_env: bool = typer.Option(False, "--allow-host-env",
+                                            help="Skip the virtual environment if the dependencies are already installed."),
 ):
     """
     Execute a script.
     """
 
-    run_script(script_name, extra_args=args)
-    Console.print()
+    from pyscript.commands.run import run_script
+    run_script(script_name, extra_args=args, allow_host_env=allow_host_env)
+    _console().print()
 
 
 @app.command()
@@ -83,13 +92,14 @@ def add(
     Add a new script.
     """
 
+    from pyscript.commands.add import add_script
     add_script(
         script_path=script_path,
         metadata_path=metadata_file,
         description=description,
         dependencies=dependencies,
     )
-    Console.print()
+    _console().print()
 
 
 @app.command()
@@ -102,8 +112,9 @@ def download(
     Download scripts from the official repository.
     """
 
+    from pyscript.commands.download import download_scripts
     download_scripts(scripts, category)
-    Console.print()
+    _console().print()
 
 
 @app.command()
@@ -118,13 +129,14 @@ def remove(
     Remove a script or a related component.
     """
 
+    from pyscript.commands.remove import remove_script
     remove_script(
         script_name=script_name,
         metadata=metadata,
         venv=venv,
         deps_to_remove=dependencies if dependencies else None
     )
-    Console.print()
+    _console().print()
 
 
 @app.command()
@@ -139,8 +151,9 @@ def update(
     Update a script and/or its metadata.
     """
 
+    from pyscript.commands.update import update_script
     update_script(script_name, new_script, metadata, update_all)
-    Console.print()
+    _console().print()
 
 
 @app.command()
@@ -149,10 +162,10 @@ def clean():
     Clean up temporary files and unused resources.
     """
 
+    from pyscript.commands.clean import clean_environment
     clean_environment()
-    Console.print()
+    _console().print()
 
 
 if __name__ == "__main__":
-    init()
     app()
@@ -1,3 +1,5 @@
+import os
+import re
 from pathlib import Path
 from typing import Optional, Any
 
@@ -8,6 +10,10 @@ from pyscript.utils.console import Console
 from pyscript.utils.parser import parse_script_name
 
 
+# Dependency in the format pkg=version or pkg, the version group is empty if missing
+_DEP_RE = re.compile(r"([^\s=]+)(?:=(\S+))?")
+
+
 def add_script(
     script_path: Path,
     metadata_path: Optional[Path] = None,
@@ -24,8 +30,10 @@ def add_script(
         dependencies: list of dependencies of the script, as tuples of values (name, version)
     """
 
-    # Check the script file exists
-    if not script_path.exists():
+    # Check the script file exists (its stat is reused to look up the cached description)
+    try:
+        script_stat = os.stat(script_path)
+    except OSError:
         Console.print_error(f"'{script_path}' does not exist", "Please provide a valid script path.")
         return
 
@@ -36,15 +44,7 @@ def add_script(
         return
 
     # Parse dependencies
-    parsed_deps = []
-    if dependencies:
-        dependencies = dependencies.split()
-        for dep in dependencies:
-            if "=" in dep:
-                pkg, ver = dep.split("=", 1)
-            else:
-                pkg, ver = dep, ""
-            parsed_deps.append((pkg, ver))
+    parsed_deps = _DEP_RE.findall(dependencies) if dependencies else []
 
     script_name = parse_script_name(script_path.stem)
 
@@ -56,7 +56,8 @@ def add_script(
 
     # Generate metadata from arguments or script docs
     try:
-        metadata = _get_metadata_from_args(script_path, metadata_path, description, parsed_deps)
+        metadata = _get_metadata_from_args(script_name, script_path, metadata_path, description, parsed_deps,
+                                           script_stat)
     except FileNotFoundError:
         Console.print_error("metadata file not found", "Be sure to provide a valid file path.")
         return
@@ -79,19 +80,23 @@ def add_script(
 
 
 def _get_metadata_from_args(
+        script_name: str,
         script_path: Path,
         metadata_path: Optional[Path] = None,
         description: Optional[str] = None,
-        dependencies: Optional[list[tuple[str, str]]] = None
+        dependencies: Optional[list[tuple[str, str]]] = None,
+        script_stat: Optional[os.stat_result] = None
     ) -> dict[str, Any]:
     """
     Return the metadata handling command inputs or retrieving them from the script.
 
     Arguments:
+        script_name: name of the script, as parsed from the script path
         script_path: path to the script
         metadata_path: path to the metadata
         description: description of the script
         dependencies: list of dependencies
+        script_stat: stat of the script file, if already available
 
     Returns:
         A dictionary of the metadata
@@ -101,8 +106,6 @@ def _get_metadata_from_args(
         ValueError: if the dependencies have a wrong format
     """
 
-    script_name = parse_script_name(script_path.stem)
-
     # If the metadata file is provided and exists return its content
     if metadata_path:
         try:
@@ -112,7 +115,7 @@ def _get_metadata_from_args(
 
     # Try to extract the description from the main method docs if not provided
     if not description:
-        description = script_manager.extract_description(script_path)
+        description = script_manager.extract_description(script_path, script_stat)
         if not description:
             Console.print_warning("no description passed and found in the script",
                           "Provide it as a docstring for the main method of the script or with the option "
@@ -1,63 +1,79 @@
+import os
 import shutil
-from pathlib import Path
 
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from pyscript.core import description_cache, script_manager
+from pyscript.core.manager import BASE_DIR, METADATA_DIR, SCRIPTS_DIR, VENVS_DIR
+from pyscript.core.venv_manager import LOCK_SUFFIX, SHARED_DIR
+from pyscript.utils.console import Console
+from pyscript.utils.progress import get_bar_progress
 
-from pyscript.core.manager import BASE_DIR, SCRIPTS_DIR, METADATA_DIR, VENVS_DIR
-from pyscript.utils.console import Console, console
+
+# Number of __pycache__ removals between two updates of the progress description
+PYCACHE_UPDATE_EVERY = 32
 
 
 def clean_environment():
     """
-    Remove orphaned metadata, orphaned venvs, and __pycache__ directories.
+    Remove orphaned metadata, orphaned venvs, orphaned scripts bytecode and __pycache__ directories.
     """
 
-    removed_metadata = 0
-    removed_venvs = 0
-    removed_pycache = 0
-
     Console.print("🧹 Cleaning environment...")
 
     # Retrieving existing scripts
-    existing_scripts = {p.stem for p in SCRIPTS_DIR.glob("*.py")}
+    existing_scripts = script_manager.existing_names()
 
-    with _get_new_progress() as progress:
-        task_id = progress.add_task("Cleaning...", total=None)
+    # Collecting everything to remove first, so that the progress total is known
+    orphan_metadata, orphan_venvs, orphan_locks, orphan_bytecode, pycaches = _find_removable(existing_scripts)
 
-        # Checking for orphan metadata files
-        for meta in METADATA_DIR.glob("*.json"):
-            script_name = meta.stem
-            if script_name not in existing_scripts:
-                progress.update(task_id, description=f"[dim]Deleting[/] [bold]{script_name}[/] metadata...")
-                meta.unlink()
-                removed_metadata += 1
-                Console.print(f"   [bold green]✔[/] Removed [bold]{script_name}[/] metadata.")
-                progress.advance(task_id)
+    # Cached descriptions are only bookkeeping of the scripts, the outdated ones are dropped silently
+    description_cache.prune()
 
-        # Checking for orphan venv directories
-        if VENVS_DIR.exists():
-            for venv in VENVS_DIR.iterdir():
-                if venv.is_dir():
-                    script_name = venv.name
-                    if script_name not in existing_scripts:
-                        progress.update(task_id, description=f"[dim]Deleting[/] [bold]{script_name}[/] virtual environment...")
-                        shutil.rmtree(venv)
-                        removed_venvs += 1
-                        Console.print(f"   [bold green]✔[/] Removed [bold]{script_name}[/] virtual environment.")
-                        progress.advance(task_id)
-
-        # Cleaning pycache
-        for pycache in BASE_DIR.rglob("__pycache__"):
-            progress.update(task_id, description=f"[dim]Deleting[/] [bold]{Path(*list(pycache.parts)[-3:])}[/]")
-            shutil.rmtree(pycache)
-            removed_pycache += 1
-            progress.advance(task_id)
+    removed_metadata = len(orphan_metadata)
+    removed_venvs = len(orphan_venvs)
+    removed_bytecode = len(orphan_bytecode)
+    removed_pycache = len(pycaches)
 
     # Render results
-    if removed_metadata == removed_venvs == removed_pycache == 0:
+    if removed_metadata == removed_venvs == removed_bytecode == removed_pycache == len(orphan_locks) == 0:
         Console.print("[bold green]✔[/] Environment already cleaned!")
         return
 
+    with get_bar_progress(spinner=False) as progress:
+        task_id = progress.add_task("Cleaning...", total=removed_metadata + removed_venvs + len(orphan_locks) + removed_bytecode + removed_pycache)
+
+        for meta in orphan_metadata:
+            script_name = os.path.basename(meta)[:-5]
+            progress.update(task_id, description=f"[dim]Deleting[/] [bold]{script_name}[/] metadata...")
+            os.unlink(meta)
+            Console.print(f"   [bold green]✔[/] Removed [bold]{script_name}[/] metadata.")
+            progress.advance(task_id)
+
+        for venv in orphan_venvs:
+            script_name = os.path.basename(venv)
+            progress.update(task_id, description=f"[dim]Deleting[/] [bold]{script_name}[/] virtual environment...")
+            if os.path.islink(venv):
+                os.unlink(venv)
+            else:
+                shutil.rmtree(venv)
+            Console.print(f"   [bold green]✔[/] Removed [bold]{script_name}[/] virtual environment.")
+            progress.advance(task_id)
+
+        # Lock files are only bookkeeping of the venvs, they are removed silently
+        for lock in orphan_locks:
+            os.unlink(lock)
+            progress.advance(task_id)
+
+        for bytecode in orphan_bytecode:
+            os.unlink(bytecode)
+            progress.advance(task_id)
+
+        for i, pycache in enumerate(pycaches):
+            if i % PYCACHE_UPDATE_EVERY == 0:
+                display = os.sep.join(pycache.rsplit(os.sep, 3)[-3:])
+                progress.update(task_id, description=f"[dim]Deleting[/] [bold]{display}[/]")
+            shutil.rmtree(pycache)
+            progress.advance(task_id)
+
     Console.print("\n[bold green]✔[/] Environment cleaned!")
 
     if removed_metadata:
@@ -66,19 +82,85 @@ def clean_environment():
     if removed_venvs:
         Console.print(f"  - Removed {removed_venvs} orphans virtual environments")
 
+    if removed_bytecode:
+        Console.print(f"  - Removed {removed_bytecode} orphans compiled scripts")
+
     if removed_pycache:
         Console.print(f"  - Removed {removed_pycache} __pycache__ directories")
 
 
-def _get_new_progress() -> Progress:
+def _find_removable(existing_scripts: set[str]) -> tuple[list[str], list[str], list[str], list[str], list[str]]:
     """
+    Walk the environment once, collecting orphan metadata files, orphan venvs (and their lock files),
+    the bytecode of deleted scripts and __pycache__ directories.
+    Shared venvs are orphan when no existing script links to them.
+
+    Arguments:
+        existing_scripts: names of the existing scripts.
+
     Returns:
-        A new progress object.
+        The paths of the orphan metadata files, of the orphan venvs, of the orphan venv lock files,
+        of the orphan scripts bytecode and of the __pycache__ directories.
     """
 
-    return Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-            transient=True
-    )
\ No newline at end of file
+    orphan_metadata, orphan_venvs, orphan_locks, orphan_bytecode, pycaches = [], [], [], [], []
+    metadata_dir, venvs_dir, shared_dir_name = str(METADATA_DIR), str(VENVS_DIR), SHARED_DIR.name
+    scripts_dir = str(SCRIPTS_DIR)
+
+    for root, dirs, files in os.walk(BASE_DIR):
+
+        # Checking for orphan metadata files
+        if root == metadata_dir:
+            orphan_metadata.extend(
+                os.path.join(root, name) for name in files
+                if name.endswith(".json") and name[:-5] not in existing_scripts
+            )
+
+        # Checking for orphan venv directories
+        elif root == venvs_dir:
+            # Links to a shared venv are listed in dirs, or in files if the shared venv is missing
+            links = [name for name in files if os.path.islink(os.path.join(root, name))]
+            linked = set()
+            for name in dirs + links:
+                if name == shared_dir_name:
+                    continue
+                path = os.path.join(root, name)
+                if name not in existing_scripts:
+                    orphan_venvs.append(path)
+                elif os.path.islink(path):
+                    linked.add(os.readlink(path))
+            orphan_locks.extend(
+                os.path.join(root, name) for name in files
+                if name.endswith(LOCK_SUFFIX) and name[:-len(LOCK_SUFFIX)] not in existing_scripts
+            )
+
+            # Checking for shared venvs no existing script links to (with their lock files)
+            if shared_dir_name in dirs:
+                with os.scandir(SHARED_DIR) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(LOCK_SUFFIX):
+                            if entry.path[:-len(LOCK_SUFFIX)] not in linked:
+                                orphan_locks.append(entry.path)
+                        elif entry.path not in linked:
+                            orphan_venvs.append(entry.path)
+
+            # Venvs are not walked: their __pycache__ directories belong to the installed packages
+            # and would only be compiled again at the next run
+            dirs.clear()
+
+        # The scripts bytecode is compiled on purpose when they are saved: only the one of deleted scripts
+        # is removed (named "<script>.<python tag>.pyc"), the directory is not walked
+        elif root == scripts_dir and "__pycache__" in dirs:
+            with os.scandir(os.path.join(root, "__pycache__")) as entries:
+                orphan_bytecode.extend(
+                    entry.path for entry in entries
+                    if entry.name.endswith(".pyc") and entry.name.split(".", 1)[0] not in existing_scripts
+                )
+            dirs.remove("__pycache__")
+
+        # Checking for pycache (pruned from the walk, there is no need to look inside it)
+        if "__pycache__" in dirs:
+            pycaches.append(os.path.join(root, "__pycache__"))
+            dirs.remove("__pycache__")
+
+    return orphan_metadata, orphan_venvs, orphan_locks, orphan_bytecode, pycaches
@@ -1,11 +1,12 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional
 
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, MofNCompleteColumn
-
 import pyscript.core.metadata_manager as metadata_manager
 import pyscript.utils.github as github
 from pyscript.core import script_manager
-from pyscript.utils.console import Console, console
+from pyscript.utils.console import Console
+from pyscript.utils.error import GitHubError
+from pyscript.utils.progress import get_bar_progress
 
 
 def download_scripts(scripts: Optional[list[str]], category: Optional[str] = None) -> None:
@@ -50,6 +51,9 @@ def download_category(category: str) -> None:
                             "This is due to an error in the official repository. Please try again. "
                             "If the error persist open an issue on GitHub.")
         return
+    except GitHubError as e:
+        Console.print_error("unable to load categories from the official repository", str(e))
+        return
 
     if category not in categories:
         Console.print_error(f"category [bold]{category}[/] not found", "Please specify a valid category.")
@@ -59,8 +63,9 @@ def download_category(category: str) -> None:
     scripts = categories[category]
 
     # Show scripts available and ask user confirmation
-    Console.print(f"The following scripts were found in [bold]{category}[/]:\n - [bold magenta]" + "[/]\n - [bold magenta]".join(
-        scripts) + "[/]")
+    lines = [f"The following scripts were found in [bold]{category}[/]:"]
+    lines.extend([f" - [bold magenta]{script}[/]" for script in scripts])
+    Console.print("\n".join(lines))
     if not Console.confirm_action("Do you want to download them?"):
         Console.print("Operation cancelled.")
         return
@@ -69,80 +74,116 @@ def download_category(category: str) -> None:
 
 
 def download_multiple_scripts(scripts: list[str]) -> None:
-    with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            MofNCompleteColumn(),
-            console=console,
-            transient=True
-    ) as progress:
+    """
+    Download and install the scripts from the official repository, skipping those already installed.
+    Scripts are downloaded concurrently and installed as soon as they are received.
+
+    Arguments:
+        scripts: List of scripts to download.
+    """
+
+    scripts = list(dict.fromkeys(scripts))  # remove duplicates, keeping the order
+
+    with get_bar_progress(disable=len(scripts) == 1) as progress:
         task_id = progress.add_task(f"Starting...", total=len(scripts))
 
+        # Check which scripts are already downloaded
+        existing = script_manager.existing_names()
+        installed_metadata = _load_installed_metadata([name for name in scripts if name in existing])
+        to_download = []
         for script_name in scripts:
-            progress.update(task_id, description=f"[cyan]Downloading[/] [bold]{script_name}[/][cyan]...[/]")
+            if script_name not in existing:
+                to_download.append(script_name)
+                continue
 
-            # Check if the script is already downloaded
-            if script_manager.exists(script_name):
+            # If the existing script is a custom script, the user must delete it to download the standard one
+            if not _is_custom_with_standard_name(installed_metadata[script_name]):
+                Console.print_warning(f"[bold]{script_name}[/bold] already installed")
+            else:
+                Console.print_warning(f"[bold]{script_name}[/] already exists as a custom script", "Delete it if you want to download the standard one.")
+            progress.advance(task_id)
+
+        if not to_download:
+            return
+
+        progress.update(task_id, description=f"[cyan]Downloading[/] [bold]{len(to_download)}[/] [cyan]scripts...[/]")
 
-                # If the existing script is a custom script, ask the user to overwrite
-                if not _is_custom_with_standard_name(script_name):
-                    Console.print_warning(f"[bold]{script_name}[/bold] already installed")
+        # Downloads are I/O bound: fetch them concurrently, results are saved from this thread only
+        with ThreadPoolExecutor(max_workers=min(8, len(to_download))) as pool:
+            futures = {pool.submit(github.load_script_bundle, script_name): script_name for script_name in to_download}
+
+            for future in as_completed(futures):
+                script_name = futures[future]
+                try:
+                    fetched = future.result()
+                except (FileNotFoundError, GitHubError) as e:
+                    Console.print_error(f"unable to download [bold]{script_name}[/bold]", str(e))
                     progress.advance(task_id)
                     continue
 
-                Console.print_warning(f"[bold]{script_name}[/] already exists as a custom script", "Delete it if you want to download the standard one.")
-                continue
+                if fetched is None:
+                    Console.print_error(f"[bold]{script_name}[/bold] not found on the official repository",
+                                        "Use the option [bold cyan]--list[/] to list all available scripts.")
+                    progress.advance(task_id)
+                    continue
 
-            # Download the metadata
-            try:
-                metadata = github.load_script_metadata(script_name)
-                metadata_manager.save(script_name, metadata)
-
-            except FileExistsError:
-                Console.print_warning(f"metadata for [bold]{script_name}[/bold] already exists")
-                Console.print(f"️🔧 Removing old metadata file...")
-
-                metadata_manager.delete(script_name)
-                metadata_manager.save(script_name, metadata)
-                pass
-            except FileNotFoundError:
-                Console.print_error(f"[bold]{script_name}[/bold] not found on the official repository",
-                                    "Use the option [bold cyan]--list[/] to list all available scripts.")
+                _install_script(script_name, *fetched)
                 progress.advance(task_id)
-                continue
 
-            # Download the script
-            try:
-                script_code = github.load_script_file(script_name)
-                script_manager.save(script_name, script_code)
-                Console.print_success(f"{script_name} installed successfully.")
-            except FileNotFoundError as e:
-                Console.print_error(f"unable to download [bold]{script_name}[/bold]", str(e))
 
-                # Rollback metadata
-                try:
-                    metadata_manager.delete(script_name)
-                except FileNotFoundError:
-                    Console.print_error(f"failed to remove metadata for [bold]{script_name}[/bold] during rollback")
-                    return
-            finally:
-                progress.advance(task_id)
+def _install_script(script_name: str, metadata: dict, script_code: str) -> None:
+    """
+    Save a downloaded script and its metadata.
+
+    Arguments:
+        script_name: Name of the script.
+        metadata: Metadata of the script.
+        script_code: Code of the script.
+    """
+
+    try:
+        metadata_manager.save(script_name, metadata)
+    except FileExistsError:
+        Console.print_warning(f"metadata for [bold]{script_name}[/bold] already exists")
+        Console.print(f"️🔧 Replacing old metadata file...")
+        metadata_manager.save(script_name, metadata, overwrite=True)
+
+    script_manager.save(script_name, script_code)
+    Console.print_success(f"{script_name} installed successfully.")
 
 
-def _is_custom_with_standard_name(script_name: str) -> bool:
+def _load_installed_metadata(script_names: list[str]) -> dict[str, dict]:
+    """
+    Load the metadata of the installed scripts, all before checking them.
+
+    Arguments:
+        script_names: Names of the installed scripts.
+
+    Returns:
+        A dictionary of the metadata by script name, empty for scripts without a metadata file.
+    """
+
+    installed_metadata = {}
+    for script_name in script_names:
+        try:
+            installed_metadata[script_name] = metadata_manager.get(script_name)
+        except FileNotFoundError:
+            installed_metadata[script_name] = {}
+    return installed_metadata
+
+
+def _is_custom_with_standard_name(metadata: dict) -> bool:
     """
     Check if a script is defined as custom (supposed it exists and should be a standard script).
     If no type is present, it's supposed to be a custom script.
 
     Arguments:
-        script_name: Name of the script.
+        metadata: Metadata of the script.
 
     Returns:
         A boolean indicating if the script is defined "custom".
     """
 
-    metadata = metadata_manager.get(script_name)
     try:
         return metadata["type"] == "custom"
     except KeyError:
@@ -1,10 +1,12 @@
+from itertools import groupby
 from pathlib import Path
+from typing import Optional, Union
 
 from rich.console import Group
 from rich.panel import Panel
 from rich.table import Table
 
-from pyscript.core.manager import SCRIPTS_DIR
+from pyscript.core import script_manager
 from pyscript.core.script_manager import extract_description
 from pyscript.utils.console import Console
 
@@ -66,25 +68,29 @@ def get_category_table(scripts: list[dict[str, str]]) -> Panel | Group:
     # Global order for category and name
     scripts_sorted = sorted(scripts, key=lambda s: (s["category"], s["name"]))
 
-    # Category order: custom first, then alphabetical
-    categories = sorted({s["category"] for s in scripts_sorted if s["category"] != "custom"})
+    # Split the scripts by category in one pass, as they are already sorted by it
+    groups = {}
+    max_name_length = 0
+    for category, group in groupby(scripts_sorted, key=lambda s: s["category"]):
+        groups[category] = list(group)
+        max_name_length = max(max_name_length, *(len(s["name"]) for s in groups[category]))
+
+    # Category order: custom first, then alphabetical (groups are already in alphabetical order)
+    categories = [c for c in groups if c != "custom"]
 
     # If there is no standard script, treat custom scripts as only scripts
     if not categories:
         return get_table(scripts)
 
     # Add custom category if there are custom scripts
-    if any(s["category"] == "custom" for s in scripts_sorted):
+    if "custom" in groups:
         categories = ["custom"] + categories
 
     category_panels = []
-    max_name_length = max(len(s["name"]) for s in scripts_sorted)
 
     # Create a panel for each category
     for category in categories:
-        group = [s for s in scripts_sorted if s["category"] == category]
-        if not group:
-            continue
+        group = groups[category]
 
         # Category scripts table
         table = Table(show_header=False, box=None, expand=True)
@@ -134,17 +140,17 @@ def get_available_scripts() -> list[dict[str, str]]:
     Returns a list of all scripts available.
 
     Returns:
-        A list of dictionaries containing the script name and its description (if one can be retrieved)
+        A list of dictionaries containing the script name, its description (if one can be retrieved) and its category
     """
 
-    return [
-        {
-            "name": f.stem, #.replace("-", " "),
-            "description": get_description(f),
-            "category": get_category(f),
-        }
-        for f in SCRIPTS_DIR.glob("*.py") if f.name != "__init__.py"
-    ]
+    # Scripts without a metadata file are known in advance, so their metadata is never looked for
+    with_metadata = metadata_mng.existing_names()
+
+    records = []
+    for script_name in script_manager.existing_names():
+        metadata = _load_metadata(script_name) if script_name in with_metadata else None
+        records.append(_load_script_record(script_name, script_manager.get_path(script_name), metadata))
+    return records
 
 
 def get_description(script_path: Path) -> str:
@@ -158,18 +164,8 @@ def get_description(script_path: Path) -> str:
         The script description if found, blank otherwise
     """
 
-    try:
-        metadata = metadata_mng.get(script_path.stem)
-        return metadata["description"]
-    except FileNotFoundError:
-        pass
-    except KeyError:
-        pass
-
-    # If the metadata file was not found or the description was not found in the metadata file,
-    # it will be retrieved from the script main method docstring
-    desc = extract_description(script_path)
-    return desc if desc else ""
+    metadata = _load_metadata(script_path.stem)
+    return _load_script_record(script_path.stem, script_path, metadata)["description"]
 
 
 def get_category(script_path: Path) -> str:
@@ -183,12 +179,51 @@ def get_category(script_path: Path) -> str:
         The script category if found, "custom" otherwise
     """
 
+    metadata = _load_metadata(script_path.stem)
+    return _load_script_record(script_path.stem, script_path, metadata)["category"]
+
+
+# Helpers
+
+def _load_metadata(script_name: str) -> Optional[dict]:
+    """
+    Load the metadata of a script.
+
+    Arguments:
+        script_name: name of the script
+
+    Returns:
+        The metadata dictionary, or None if the script has no metadata file
+    """
+
     try:
-        metadata = metadata_mng.get(script_path.stem)
-        return metadata["category"]
+        return metadata_mng.get(script_name)
     except FileNotFoundError:
-        pass
-    except KeyError:
-        pass
+        return None
+
+
+def _load_script_record(script_name: str, script_path: Union[str, Path], metadata: Optional[dict]) -> dict[str, str]:
+    """
+    Build the record of a script shown in the list from its metadata.
+    The description falls back to the main method docstring and the category to "custom".
+
+    Arguments:
+        script_name: name of the script
+        script_path: path to the script, used only if the description must be read from the docstring
+        metadata: metadata of the script, None if it has no metadata file
+
+    Returns:
+        A dictionary containing the script name, description and category
+    """
+
+    metadata = metadata or {}
+
+    # If the metadata file was not found or the description was not found in the metadata file,
+    # it will be retrieved from the script main method docstring
+    description = metadata.get("description") or extract_description(Path(script_path))
 
-    return "custom"
\ No newline at end of file
+    return {
+        "name": script_name,
+        "description": description if description else "",
+        "category": metadata.get("category", "custom"),
+    }
@@ -1,3 +1,4 @@
+from enum import IntFlag
 from typing import Optional
 
 from pyscript.core import script_manager, metadata_manager
@@ -5,6 +6,17 @@ from pyscript.core.venv_manager import delete, delete_dependencies
 from pyscript.utils.console import Console
 
 
+class Action(IntFlag):
+    """
+    Components of a script to remove.
+    """
+
+    SCRIPT = 1
+    METADATA = 2
+    VENV = 4
+    DEPENDENCIES = 8
+
+
 def remove_script(script_name: str, metadata: bool = False, venv: bool = False, deps_to_remove: Optional[str] = None):
     """
     Remove:
@@ -28,13 +40,13 @@ def remove_script(script_name: str, metadata: bool = False, venv: bool = False,
         Console.print_error(f"script '{script_name}' not found")
         return
 
-    to_do: dict[str, bool] = _handle_args(metadata, venv, deps_to_remove)
+    to_do: Action = _handle_args(metadata, venv, deps_to_remove)
 
-    if not _user_confirm(script_name, to_do["metadata"], to_do["script"]):
+    if not _user_confirm(script_name, bool(to_do & Action.METADATA), bool(to_do & Action.SCRIPT)):
         Console.print("Operation cancelled.")
         return
 
-    if to_do["metadata"]:
+    if to_do & Action.METADATA:
         Console.print(f"🔧 Deleting metadata file for [bold]{script_name}[/bold]...")
         try:
             metadata_manager.delete(script_name)
@@ -42,27 +54,29 @@ def remove_script(script_name: str, metadata: bool = False, venv: bool = False,
         except FileNotFoundError:
             Console.print_warning(f"no metadata file for [bold]{script_name}[/bold] found")
 
-    if to_do["venv"]:
+    if to_do & Action.VENV:
         try:
             delete(script_name)
             Console.print_success(f"Virtual environment for {script_name} deleted.")
         except FileNotFoundError:
             Console.print_warning(f"no virtual environment for [bold]{script_name}[/bold] found")
 
-    if to_do["dependencies"]:
+    if to_do & Action.DEPENDENCIES:
         deps = _parse_deps(deps_to_remove)
         Console.print(f"🔧 Uninstalling dependencies {', '.join([f'[bold]{d}[/]' for d in deps])} "
                       f"for [bold]{script_name}[/bold]...")
-        delete_dependencies(script_name, deps)
-        Console.print_success(f"Dependencies for [bold]{script_name}[/bold] uninstalled.")
+        if delete_dependencies(script_name, deps):
+            Console.print_success(f"Dependencies for [bold]{script_name}[/bold] uninstalled.")
+        else:
+            Console.print_warning(f"no dependency uninstalled for [bold]{script_name}[/bold]")
 
-    if to_do["script"]:
+    if to_do & Action.SCRIPT:
         Console.print(f"🔧 Deleting script file [bold]{script_name}[/bold]...")
         script_manager.delete(script_name)
         Console.print_success(f"Script '{script_name}' deleted.")
 
 
-def _handle_args(metadata: bool = False, venv: bool = False, deps_to_remove: Optional[list[str]] = None) -> dict[str, bool]:
+def _handle_args(metadata: bool = False, venv: bool = False, deps_to_remove: Optional[str] = None) -> Action:
     """
     Handle command arguments, deciding what action will be taken.
 
@@ -72,30 +86,23 @@ def _handle_args(metadata: bool = False, venv: bool = False, deps_to_remove: Opt
         deps_to_remove: `deps_to_remove` argument.
 
     Returns:
-        A dictionary of actions to be performed or not.
+        The flags of the actions to be performed.
     """
 
-    to_do: dict[str, bool] = {
-        "script": False,
-        "metadata": False,
-        "venv": False,
-        "dependencies": False,
-    }
+    to_do = Action(0)
     if metadata:
-        to_do["metadata"] = True
+        to_do |= Action.METADATA
     if venv:
-        to_do["venv"] = True
+        to_do |= Action.VENV
     if deps_to_remove:
-        to_do["dependencies"] = True
+        to_do |= Action.DEPENDENCIES
     if not metadata and not venv and not deps_to_remove:
-        to_do["script"] = True
-        to_do["metadata"] = True
-        to_do["venv"] = True
+        to_do |= Action.SCRIPT | Action.METADATA | Action.VENV
     return to_do
 
 
 def _parse_deps(deps_string: str) -> list[str]:
-    return deps_string.split(" ")
+    return deps_string.split()
 
 
 def _user_confirm(script_name: str, metadata: bool = False, script: bool = False) -> bool:
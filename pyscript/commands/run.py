@@ -1,4 +1,4 @@
-import importlib
+import importlib.util
 import shlex
 import sys
 from pathlib import Path
@@ -6,43 +6,51 @@ from typing import Optional, Any
 
 import pyscript.core.metadata_manager as metadata_manager
 from pyscript.core import script_manager
-from pyscript.core.script_manager import get_available_scripts
-from pyscript.core.venv_manager import prepare, recreate
 from pyscript.utils.console import Console
 from pyscript.utils.error import VenvError
 
 
-def run_script(script_name: str, extra_args: Optional[Any] = None):
+def run_script(script_name: str, extra_args: Optional[Any] = None, allow_host_env: bool = False):
     """
     Execute the specified script with the optional arguments. If needed, it creates the virtual environment installing eventual dependencies.
 
     Arguments:
         script_name: the name of the script to execute
         extra_args: a list of extra arguments to pass to the script
+        allow_host_env: whether to run without a virtual environment if the running interpreter has all the dependencies
     """
 
-    available = get_available_scripts()
-
     # Check script name passed exists
-    if script_name not in available:
+    if not script_manager.exists(script_name):
         Console.print_error(f"script [bold]{script_name}[/bold] not found",
                             "Use [bold green]list[/bold green] to see all available scripts.")
         return
 
+    script_path = script_manager.get_path(script_name)
+
     # Retrieve script metadata if exists, create them otherwise
     try:
         metadata = metadata_manager.get(script_name)
         metadata_manager.complete(metadata)
     except FileNotFoundError:
-        metadata = metadata_manager.extract(script_name)
+        metadata = metadata_manager.extract(script_name, script_path)
         metadata_manager.save(script_name, metadata)
 
     # Prepare virtual environment if necessary
-    try:
-        env_path = prepare(script_name, metadata["dependencies"])
-    except VenvError:
-        Console.print_error(f"Unable to prepare the virtual environment for [bold]{script_name}[/]")
-        return
+    env_path = None
+    # Curated metadata may declare that the dependencies include the transitive ones
+    assume_closed = bool(metadata.get("closed_dependencies"))
+    if metadata["dependencies"]:
+        # The venv manager is loaded only for scripts that need a virtual environment
+        from pyscript.core.venv_manager import prepare, recreate, python_path, satisfied_by_host
+
+        # Isolation can be given up for the dependencies already installed in the running interpreter
+        if not (allow_host_env and satisfied_by_host(metadata["dependencies"])):
+            try:
+                env_path = prepare(script_name, metadata["dependencies"], assume_closed=assume_closed)
+            except VenvError:
+                Console.print_error(f"Unable to prepare the virtual environment for [bold]{script_name}[/]")
+                return
 
     # Choose to execute the script into the virtual env or directly
     if env_path is None:
@@ -55,7 +63,7 @@ def run_script(script_name: str, extra_args: Optional[Any] = None):
         max_try = 2
         # Try for `max_try` times to recreate the virtual env in case the executable was not found
         for attempt in range(max_try):
-            python_exec = env_path / ("Scripts" if sys.platform == "win32" else "bin") / "python"
+            python_exec = python_path(env_path)
 
             # Recreate the virtual environment in case the python executable was not found
             if python_exec.exists():
@@ -67,13 +75,7 @@ def run_script(script_name: str, extra_args: Optional[Any] = None):
                 return
 
             Console.print_warning(f"Python executable not found in the virtual environment for [bold]{script_name}[/bold]")
-            env_path = recreate(script_name, metadata["dependencies"])
-
-    if not script_manager.exists(script_name):
-        Console.print_error(f"Script not found: [bold]{script_name}[/bold]")
-        return
-
-    script_path = script_manager.get_path(script_name)
+            env_path = recreate(script_name, metadata["dependencies"], assume_closed)
 
     # Load the module dynamically
     try:
@@ -1,15 +1,17 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional
 
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, MofNCompleteColumn
-
 import pyscript.core.metadata_manager as metadata_manager
 from pyscript.core import script_manager
 from pyscript.core.script_manager import get_available_scripts
 from pyscript.utils import file
-from pyscript.utils.console import Console, console
+from pyscript.utils.console import Console
+from pyscript.utils.progress import get_bar_progress
 
 import pyscript.utils.github as github
+from pyscript.utils.error import GitHubError, NotModified
 
 
 def update_script(
@@ -106,66 +108,100 @@ def update_all_scripts() -> None:
     """
     Update all standard scripts, checking which ones are obsolete
     and updating them to the last version available on the official repository.
+    Exits with a non-zero code if some script could not be checked or updated.
     """
 
     Console.print("🔧 Upgrading all scripts...")
     standard = _get_default_scripts()
 
-    # Create a progress view for an optimal visualization of the processo for the user
-    with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            MofNCompleteColumn(),
-            console=console,
-            transient=True
-    ) as progress:
-
-        task_id = progress.add_task("Updating...", total=len(standard))
-
-        # Iterate for each standard script
-        for script, version in standard.items():
-            progress.update(task_id, description=f"Checking [bold]{script}[/] version...")
-
-            # Load metadata from the official repository (handling missing metadata)
-            try:
-                repo_metadata = github.load_script_metadata(script)
-            except FileNotFoundError:
-                Console.print(f"   [bold yellow]⚠[/] Failed to load metadata for script '{script}'. "
-                              f"Metadata not present on the official repository (skipped).")
-                progress.advance(task_id)
-                continue
-
-            # Get repo script version (handling invalid metadata)
-            try:
-                repo_version = float(repo_metadata["version"])
-            except ValueError:
-                Console.print_error(f"   [bold yellow]⚠[/] Invalid metadata on the repository for [bold]{script}[/] (skipped).")
-                progress.advance(task_id)
-                continue
-
-            # Check if the script is up-to-date
-            if repo_version == float(version):
-                Console.print_success(f"[bold]{script}[/] is up-to-date.")
-                progress.advance(task_id)
-                continue
+    if not standard:
+        Console.print_success("All scripts are up-to-date.")
+        return
 
-            progress.update(task_id, description=f"Updating [bold]{script}[/]...")
+    # Create a progress view for an optimal visualization of the processo for the user
+    with get_bar_progress(disable=len(standard) == 1) as progress:
+
+        task_id = progress.add_task("Checking versions...", total=len(standard))
+
+        # Requests are I/O bound: they are sent concurrently in two waves, first all the metadata
+        # then the files of the obsolete scripts. Results are handled from this thread only
+        with ThreadPoolExecutor(max_workers=min(16, len(standard))) as pool:
+            futures = {pool.submit(github.load_script_metadata, script, etag): (script, version)
+                       for script, version, etag in standard}
+            obsolete = {}
+            failed = []
+
+            for future in as_completed(futures):
+                script, version = futures[future]
+
+                # Load metadata from the official repository (handling missing metadata)
+                try:
+                    repo_metadata = future.result()
+                except NotModified:
+                    # Metadata unchanged since the script was installed, no need to compare versions
+                    Console.print_success(f"[bold]{script}[/] is up-to-date.")
+                    progress.advance(task_id)
+                    continue
+                except FileNotFoundError:
+                    Console.print(f"   [bold yellow]⚠[/] Failed to load metadata for script '{script}'. "
+                                  f"Metadata not present on the official repository (skipped).")
+                    failed.append(script)
+                    progress.advance(task_id)
+                    continue
+                except GitHubError as e:
+                    Console.print(f"   [bold yellow]⚠[/] Failed to load metadata for script '{script}'. {e} (skipped).")
+                    failed.append(script)
+                    progress.advance(task_id)
+                    continue
+
+                # Get repo script version (handling invalid metadata)
+                try:
+                    repo_version = metadata_manager.parse_version(repo_metadata["version"])
+                except ValueError:
+                    Console.print_error(f"   [bold yellow]⚠[/] Invalid metadata on the repository for [bold]{script}[/] (skipped).")
+                    failed.append(script)
+                    progress.advance(task_id)
+                    continue
+
+                # Check if the script is up-to-date
+                if repo_version == version:
+                    Console.print_success(f"[bold]{script}[/] is up-to-date.")
+                    progress.advance(task_id)
+                    continue
+
+                obsolete[script] = repo_metadata
+
+            progress.update(task_id, description=f"Updating [bold]{len(obsolete)}[/] scripts...")
+
+            # Download the script files from the official repository
+            futures = {pool.submit(github.load_script_file, script): script for script in obsolete}
+
+            for future in as_completed(futures):
+                script = futures[future]
+                try:
+                    content = future.result()
+                except FileNotFoundError:
+                    Console.print(f"   [bold yellow]⚠[/] Script '{script}' not found on the official repository (skipped).")
+                    failed.append(script)
+                    progress.advance(task_id)
+                    continue
+                except GitHubError as e:
+                    Console.print(f"   [bold yellow]⚠[/] Failed to download script '{script}'. {e} (skipped).")
+                    failed.append(script)
+                    progress.advance(task_id)
+                    continue
+
+                # Save the new script and its metadata
+                script_manager.save(script, content)
+                metadata_manager.save(script, obsolete[script], True)
+                Console.print(f"   [green]✔[/] [bold]{script}[/] is now up-to-date.")
 
-            # Download the script file from the official repository
-            try:
-                content = github.load_script_file(script)
-            except FileNotFoundError:
-                Console.print(f"   [bold yellow]⚠[/] Script '{script}' not found on the official repository (skipped).")
                 progress.advance(task_id)
-                continue
-
-            # Save the new script and its metadata
-            script_manager.save(script, content)
-            metadata_manager.save(script, repo_metadata, True)
-            Console.print(f"   [green]✔[/] [bold]{script}[/] is now up-to-date.")
 
-            progress.advance(task_id)
+    if failed:
+        Console.print_error(f"{len(failed)} of {len(standard)} scripts could not be updated",
+                            ", ".join(f"[bold]{script}[/]" for script in sorted(failed)))
+        sys.exit(1)
 
     Console.print_success("All scripts are up-to-date.")
 
@@ -180,37 +216,46 @@ def update_standard(script: str) -> None:
 
     Console.print(f"🔧 Updating [bold]{script}[/]...")
 
-    # Load script metadata from the repository
     try:
-        repo_metadata = github.load_script_metadata(script)
+        metadata = metadata_manager.get(script)
+    except FileNotFoundError:
+        metadata = {}  # no metadata, it can't be a standard script
+    is_standard = metadata.get("type") == "standard"
+
+    # Load script metadata from the repository, unless it didn't change since the standard script was installed
+    try:
+        repo_metadata = github.load_script_metadata(script, metadata.get("_etag") if is_standard else None)
+    except NotModified:
+        Console.print_success(f"[bold]{script}[/] is up-to-date.")
+        return
     except FileNotFoundError:
         Console.print_error(f"script '{script}' not found on the official repository.")
         return
+    except GitHubError as e:
+        Console.print_error(f"unable to load the metadata of [bold]{script}[/] from the official repository", str(e))
+        return
 
     # Check if the script passed is standard
-    is_standard = True
-    metadata = metadata_manager.get(script)
-    if "type" not in metadata.keys() or metadata["type"] != "standard":
+    if not is_standard:
         Console.print_warning(f"local [bold]{script}[/] is not a standard script")
         if not Console.confirm_action("Do you want to replace it with the latest version from the official repository?"):
             Console.print("Operation cancelled.")
             return
-        is_standard = False
 
     if is_standard:
         # Get local script version
         try:
-            version = float(metadata["version"])
+            version = metadata_manager.parse_version(metadata["version"])
         except KeyError:
             Console.print_warning(f"no version specified for [bold]{script}[/] in the metadata.", "Downloading the latest version...")
-            version = 0
+            version = ()
         except ValueError:
             Console.print_warning("version specified in the is invalid.")
             return
 
         # Get repo script version (handling invalid metadata)
         try:
-            repo_version = float(repo_metadata["version"])
+            repo_version = metadata_manager.parse_version(repo_metadata["version"])
         except ValueError:
             Console.print_error(f"invalid metadata on the repository for [bold]{script}[/].")
             return
@@ -226,6 +271,9 @@ def update_standard(script: str) -> None:
     except FileNotFoundError:
         Console.print_error(f"script '{script}' not found on the official repository.")
         return
+    except GitHubError as e:
+        Console.print_error(f"unable to download [bold]{script}[/] from the official repository", str(e))
+        return
 
     # Save the new script and its metadata
     script_manager.save(script, content)
@@ -302,29 +350,49 @@ def _update_single_metadata(script: str, script_path: str) -> None:
     metadata_manager.update(script, new_values)
 
 
-def _get_default_scripts() -> dict[str, float]:
+def _get_default_scripts() -> list[tuple[str, tuple[int, ...], Optional[str]]]:
     """
-    Return the default scripts and their current versions.
+    Return the default scripts as (name, current version, ETag of the metadata if known) rows,
+    everything the update needs from the installed metadata, so it is never read again.
     """
 
-    scripts = get_available_scripts()
-    standard = {}
+    # Scripts without a metadata file can't be standard, so their metadata is never looked for
+    with_metadata = metadata_manager.existing_names()
+    scripts = [script for script in get_available_scripts() if script in with_metadata]
+    standard = []
 
-    for script in scripts:
-        metadata = metadata_manager.get(script)
-        if "type" not in metadata.keys():
+    if not scripts:
+        return standard
+
+    # Metadata files are read concurrently, the results are checked from this thread only
+    with ThreadPoolExecutor(max_workers=min(32, len(scripts))) as pool:
+        loaded = list(pool.map(_safe_get_metadata, scripts))
+
+    for script, metadata in zip(scripts, loaded):
+        if metadata is None or "type" not in metadata.keys():
             continue
         if metadata["type"] == "standard":
             try:
-                version = float(metadata["version"])
+                version = metadata_manager.parse_version(metadata["version"])
             except KeyError:
                 Console.print_warning(f"standard script [bold]{script}[/] has no version saved in the metadata",
                                       "The latest available on the official repository will be downloaded.")
-                version = 0.0
+                version = ()
             except ValueError:
                 Console.print_warning(f"invalid version saved in the metadata for [bold]{script}[/]",
                                       "The latest available on the official repository will be downloaded.")
-                version = 0.0
-            standard[script] = version
+                version = ()
+            standard.append((script, version, metadata.get("_etag")))
 
-    return standard
\ No newline at end of file
+    return standard
+
+
+def _safe_get_metadata(script: str) -> Optional[dict]:
+    """
+    Returns the metadata of a script, None if its metadata file was removed in the meantime.
+    """
+
+    try:
+        return metadata_manager.get(script)
+    except FileNotFoundError:
+        return None
@@ -0,0 +1,110 @@
+import atexit
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+from pyscript.core.manager import CACHE_DIR
+
+
+# Scripts description already extracted, by absolute script path
+CACHE_FILE = CACHE_DIR / "descriptions.json"
+
+_cache: Optional[dict[str, dict]] = None
+_changed = False
+
+
+def get(script_path: Path, stat: os.stat_result) -> Optional[str]:
+    """
+    Get the cached description of a script, if the script did not change since it was cached.
+
+    Arguments:
+        script_path: path to the script
+        stat: current stat of the script file
+
+    Returns:
+        The cached description, None if it is missing or outdated
+    """
+
+    entry = _load().get(os.path.abspath(script_path))
+    if entry and entry["mtime"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+        return entry["description"]
+    return None
+
+
+def put(script_path: Path, stat: os.stat_result, description: str) -> None:
+    """
+    Cache the description of a script. The cache file is written once, at the end of the execution.
+
+    Arguments:
+        script_path: path to the script
+        stat: stat of the script file the description was extracted from
+        description: description of the script
+    """
+
+    global _changed
+
+    _load()[os.path.abspath(script_path)] = {
+        "mtime": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "description": description,
+    }
+
+    if not _changed:
+        atexit.register(_flush)
+        _changed = True
+
+
+def prune() -> int:
+    """
+    Drop the cached descriptions of the scripts deleted or changed since they were cached, and write the cache file.
+
+    Returns:
+        The number of descriptions dropped
+    """
+
+    cache = _load()
+    outdated = []
+    for path, entry in cache.items():
+        try:
+            stat = os.stat(path)
+        except OSError:
+            outdated.append(path)
+            continue
+        if entry.get("mtime") != stat.st_mtime_ns or entry.get("size") != stat.st_size:
+            outdated.append(path)
+
+    for path in outdated:
+        del cache[path]
+    if outdated:
+        _flush()
+    return len(outdated)
+
+
+# Helpers
+
+def _load() -> dict[str, dict]:
+    """
+    Returns the cache, reading the cache file at the first access.
+    """
+
+    global _cache
+
+    if _cache is None:
+        try:
+            _cache = json.loads(CACHE_FILE.read_text())
+        except (OSError, ValueError):
+            _cache = {}  # Missing or corrupted cache, it will be rebuilt
+    return _cache
+
+
+def _flush() -> None:
+    """
+    Write the cache file.
+    """
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        CACHE_FILE.write_text(json.dumps(_cache))
+    except OSError:
+        pass  # The cache is only an optimization
@@ -1,3 +1,4 @@
+import os
 import shutil
 from pathlib import Path
 
@@ -6,6 +7,8 @@ BASE_DIR = Path.home() / ".pyscript"
 SCRIPTS_DIR = BASE_DIR / "scripts"
 METADATA_DIR = BASE_DIR / "metadata"
 VENVS_DIR = BASE_DIR / "venvs"
+CACHE_DIR = BASE_DIR / "cache"
+WHEELHOUSE_DIR = BASE_DIR / "wheelhouse"
 
 INITIALIZED_FILE = BASE_DIR / ".initialized"
 
@@ -15,14 +18,15 @@ def init():
     Initialize the environment.
     """
 
-    # Create environment's directories
-    for d in [BASE_DIR, SCRIPTS_DIR, METADATA_DIR, VENVS_DIR]:
-        d.mkdir(parents=True, exist_ok=True)
+    # Already initialized: a directory removed after the first run is created again where it is needed
+    if INITIALIZED_FILE.exists():
+        return
 
     # Perform initialization action needed only at the first run of the command
-    if not INITIALIZED_FILE.exists():
-        _install_default_scripts()
-        INITIALIZED_FILE.touch()  # Create the flag
+    for d in [BASE_DIR, SCRIPTS_DIR, METADATA_DIR, VENVS_DIR]:
+        d.mkdir(parents=True, exist_ok=True)
+    _install_default_scripts()
+    INITIALIZED_FILE.touch()  # Create the flag
 
 
 def _install_default_scripts():
@@ -32,15 +36,20 @@ def _install_default_scripts():
 
     default_dir = Path(__file__).parent.parent / "default_scripts"
 
-    for py_file in default_dir.glob("*.py"):
-        script_name = py_file.stem
-        target = SCRIPTS_DIR / py_file.name
+    with os.scandir(default_dir) as entries:
+        names = {e.name for e in entries if e.is_file()}
+
+    for file_name in names:
+        if not file_name.endswith(".py"):
+            continue
+        script_name = file_name[:-3]
+        target = SCRIPTS_DIR / file_name
 
         if not target.exists():
-            shutil.copy(py_file, target)
+            shutil.copyfile(default_dir / file_name, target)
 
         # copy metadata JSON if exists
-        meta_src = default_dir / f"{script_name}.json"
-        meta_dst = METADATA_DIR / f"{script_name}.json"
-        if meta_src.exists() and not meta_dst.exists():
-            shutil.copy(meta_src, meta_dst)
\ No newline at end of file
+        meta_name = f"{script_name}.json"
+        meta_dst = METADATA_DIR / meta_name
+        if meta_name in names and not meta_dst.exists():
+            shutil.copyfile(default_dir / meta_name, meta_dst)
@@ -1,10 +1,11 @@
-import json
+import functools
+import os
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 from pyscript.core import script_manager
 from pyscript.core.manager import METADATA_DIR
-from pyscript.core.script_manager import extract_description, extract_dependencies
+from pyscript.core.script_manager import extract_metadata
 from pyscript.utils import file
 
 REQUIRED_FIELDS = [
@@ -28,6 +29,22 @@ def exists(script_name: str) -> bool:
     return Path(path).exists()
 
 
+def existing_names() -> set[str]:
+    """
+    Returns the names of all scripts having a metadata file, listing the metadata directory once.
+    Useful to check many scripts without a filesystem access for each of them.
+
+    Returns:
+        A set of the scripts name with a metadata file.
+    """
+
+    try:
+        with os.scandir(METADATA_DIR) as entries:
+            return {e.name[:-5] for e in entries if e.name.endswith(".json")}
+    except FileNotFoundError:
+        return set()  # The metadata directory was removed, no script has metadata
+
+
 def generate(script_name: str,
              description: str,
              dependencies: list[tuple[str, str]]
@@ -60,7 +77,7 @@ def generate(script_name: str,
     return metadata
 
 
-def extract(script_name: str) -> dict:
+def extract(script_name: str, script_path: Optional[Path] = None) -> dict:
     """
     Extract the metadata from a script.
     Features:
@@ -69,14 +86,14 @@ def extract(script_name: str) -> dict:
 
     Arguments:
         script_name: name to the script
+        script_path: path to the script, if already known
 
     Returns:
         a dictionary of the metadata
     """
 
-    script_path = script_manager.get_path(script_name)
-    description = extract_description(script_path)
-    dependencies = extract_dependencies(script_path)
+    script_path = script_path or script_manager.get_path(script_name)
+    description, dependencies = extract_metadata(script_path)
 
     metadata = {
         "name": script_name,
@@ -100,14 +117,13 @@ def save(script_name: str, metadata: dict, overwrite: bool = False) -> None:
         FileExistsError: if the metadata file for the given name already exists
     """
 
-    METADATA_DIR.mkdir(exist_ok=True)
+    METADATA_DIR.mkdir(parents=True, exist_ok=True)
     metadata_file = _get_path(script_name)
 
-    if metadata_file.exists() and not overwrite:
+    if not overwrite and metadata_file.exists():
         raise FileExistsError(script_name)
 
-    metadata_file.touch()
-    metadata_file.write_text(json.dumps(metadata, indent=4))
+    file.write_json(metadata_file, metadata)
 
 
 def delete(script_name: str) -> None:
@@ -164,10 +180,10 @@ def get(script_name: str) -> dict:
 
     metadata_file = _get_path(script_name)
 
-    if not metadata_file.exists():
-        raise FileNotFoundError(f"metadata file for {script_name} doesn't exist.")
-
-    return file.get_json(metadata_file)
+    try:
+        return file.get_json(metadata_file)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"metadata file for {script_name} doesn't exist.") from None
 
 
 def get_from_path(path: Path) -> dict:
@@ -181,10 +197,10 @@ def get_from_path(path: Path) -> dict:
         a dictionary of the metadata
     """
 
-    if not path.exists():
-        raise FileNotFoundError(f"metadata file {path} doesn't exist.")
-
-    return file.get_json(path)
+    try:
+        return file.get_json(path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"metadata file {path} doesn't exist.") from None
 
 
 def complete(metadata: dict[str, Any], required_fields: Optional[list[tuple[str, Any]]]=None) -> None:
@@ -207,8 +223,31 @@ def complete(metadata: dict[str, Any], required_fields: Optional[list[tuple[str,
             metadata[field] = value
 
 
+@functools.lru_cache(maxsize=1024)
+def parse_version(version: Union[str, int, float]) -> tuple[int, ...]:
+    """
+    Parse a script version (e.g. "1.10") into a tuple of integers, to compare versions component by component.
+    Trailing zeros are ignored, so "1.0" and "1" are the same version.
+
+    Arguments:
+        version: the version, as saved in the metadata
+
+    Returns:
+        A tuple of the version components
+
+    Raises:
+        ValueError: if the version is not made of dot separated integers
+    """
+
+    parts = [int(part) for part in str(version).split(".")]
+    while parts and parts[-1] == 0:
+        parts.pop()
+    return tuple(parts)
+
+
 # Helpers
 
+@functools.lru_cache(maxsize=1024)
 def _get_path(script_name: str) -> Path:
     """
     Get the metadata file path of a script from its name.
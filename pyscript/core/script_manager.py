@@ -1,14 +1,21 @@
 import ast
+import functools
 import importlib
-import inspect
+import os
+import py_compile
 import sys
 from pathlib import Path
+from typing import Iterator, Optional, Union
 
+from pyscript.core import description_cache
 from pyscript.core.manager import SCRIPTS_DIR
 
 
-# Set of standard moduls to ignore
-STANDARD_MODULES = set(sys.builtin_module_names).union(set(sys.stdlib_module_names))
+# Fields of the nodes holding nested statements (or except handlers and match cases, holding a body)
+_BLOCK_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
+
+# Names of the scripts, with the modification time of the scripts directory they were listed at
+_scripts_cache: Optional[tuple[int, frozenset[str]]] = None
 
 
 def get_available_scripts() -> list[str]:
@@ -19,7 +26,19 @@ def get_available_scripts() -> list[str]:
         A list of all scripts name available.
     """
 
-    return [f.stem for f in SCRIPTS_DIR.glob("*.py") if f.name != "__init__.py"]
+    return list(_get_names())
+
+
+def existing_names() -> set[str]:
+    """
+    Returns the names of all existing scripts, listing the scripts directory once.
+    Useful to check the existence of many scripts without a filesystem access for each of them.
+
+    Returns:
+        A set of all scripts name available.
+    """
+
+    return set(_get_names())
 
 
 def get_path(name: str) -> Path:
@@ -33,7 +52,7 @@ def get_path(name: str) -> Path:
         The path to the script.
     """
 
-    return SCRIPTS_DIR / f"{name}.py"
+    return _script_path(name)
 
 
 def exists(name: str) -> bool:
@@ -47,20 +66,26 @@ def exists(name: str) -> bool:
         A boolean indicating whether a script exists.
     """
 
-    return (SCRIPTS_DIR / f"{name}.py").exists()
+    return name in _get_names()
 
 
 def delete(name: str) -> None:
     """
-    Deletes a script file.
+    Deletes a script file, along with the bytecode compiled when it was saved.
 
     Arguments:
         name: The name of the script.
     """
 
-    path = SCRIPTS_DIR / f"{name}.py"
+    path = _script_path(name)
     if path.exists():
         path.unlink()
+        _invalidate_names()
+
+    try:
+        os.unlink(importlib.util.cache_from_source(str(path)))
+    except OSError:
+        pass  # Never compiled, or compiled with another python version
 
 
 def save(name: str, content: str) -> None:
@@ -72,37 +97,47 @@ def save(name: str, content: str) -> None:
         content: The content to be saved.
     """
 
-    path = SCRIPTS_DIR / f"{name}.py"
+    path = _script_path(name)
+    SCRIPTS_DIR.mkdir(parents=True, exist_ok=True)
     path.write_text(content)
+    _invalidate_names()
 
+    # Compile the script now, so the first run loads the cached bytecode like the later ones
+    if not sys.dont_write_bytecode:
+        try:
+            py_compile.compile(str(path), doraise=True)
+        except (py_compile.PyCompileError, OSError):
+            pass  # The error is reported when the script is run
 
-def extract_description(script_path: Path) -> str:
+
+def extract_description(script_path: Path, stat: Optional[os.stat_result] = None) -> str:
     """
     Returns the script main method docstring from a generic python file, if available.
+    Descriptions are cached and extracted again only if the script file changed.
 
     Arguments:
         script_path: path to the script
+        stat: stat of the script file, if already available
 
     Returns:
         the script main method docs if available, blank otherwise
     """
 
     try:
-        # Load dynamically the module from the Python file
-        module_name = script_path.stem
-        spec = importlib.util.spec_from_file_location(module_name, script_path)
-        module = importlib.util.module_from_spec(spec)
-        sys.modules[module_name] = module
-        spec.loader.exec_module(module)
-
-        # Check the main method exists and get the docstring
-        if hasattr(module, 'main'):
-            return inspect.getdoc(module.main)
-        else:
-            return ""
+        stat = stat or os.stat(script_path)
+    except OSError:
+        return ""
 
-    except Exception:
-        return ""  # Return blank in case of error
+    description = description_cache.get(script_path, stat)
+    if description is not None:
+        return description
+
+    description = _load_description(script_path)
+    if description is None:
+        return ""  # Not cached, the script may load correctly in the future
+
+    description_cache.put(script_path, stat, description)
+    return description
 
 
 def extract_dependencies(script_path: Path) -> list[tuple[str, str]]:
@@ -116,31 +151,159 @@ def extract_dependencies(script_path: Path) -> list[tuple[str, str]]:
         a list of tuples containing the third party dependencies as (name, version)
     """
 
-    deps = set()  # use a set to avoid duplicates
+    with open(script_path, "r") as f:
+        tree = ast.parse(f.read(), filename=str(script_path))
+
+    return _get_dependencies(tree)
+
+
+def extract_metadata(script_path: Path) -> tuple[str, list[tuple[str, str]]]:
+    """
+    Analyze the script to retrive both its description and its third party dependencies, parsing it once.
 
+    Arguments:
+        script_path: path of the script
+
+    Returns:
+        the script main method docs (blank if not available) and a list of tuples containing
+        the third party dependencies as (name, version)
+    """
+
+    stat = os.stat(script_path)
     with open(script_path, "r") as f:
         tree = ast.parse(f.read(), filename=str(script_path))
 
-        for node in ast.walk(tree):
-            # Caso: import X, import X.y, import X.y.z
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    top = _normalize_module_name(alias.name)
-                    if not _is_standard_module(top):
-                        deps.add(top)
-
-            # Caso: from X import Y
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    top = _normalize_module_name(node.module)
-                    if not _is_standard_module(top):
-                        deps.add(top)
+    description = _get_main_docstring(tree)
+    description_cache.put(script_path, stat, description)
+
+    return description, _get_dependencies(tree)
+
+
+# Helpers
+
+@functools.lru_cache(maxsize=1024)
+def _script_path(name: str) -> Path:
+    """
+    Returns the path of a script from its name.
+    """
+
+    return SCRIPTS_DIR / f"{name}.py"
+
+
+def _get_names() -> frozenset[str]:
+    """
+    Returns the names of all existing scripts. The scripts directory is listed again only if it was modified.
+    """
+
+    global _scripts_cache
+
+    try:
+        mtime = os.stat(SCRIPTS_DIR).st_mtime_ns
+    except FileNotFoundError:
+        return frozenset()  # The scripts directory was removed, there are no scripts
+    if _scripts_cache is None or _scripts_cache[0] != mtime:
+        with os.scandir(SCRIPTS_DIR) as entries:
+            names = frozenset(e.name[:-3] for e in entries
+                              if e.name.endswith(".py") and e.name != "__init__.py" and e.is_file())
+        _scripts_cache = (mtime, names)
+    return _scripts_cache[1]
+
+
+def _invalidate_names() -> None:
+    """
+    Forget the cached script names, as the directory mtime may not change within its timestamp resolution.
+    """
+
+    global _scripts_cache
+    _scripts_cache = None
+
+
+def _load_description(script_path: Path) -> Optional[str]:
+    """
+    Parse the script and returns its main method docstring. The script is never executed.
+
+    Arguments:
+        script_path: path to the script
+
+    Returns:
+        the script main method docs, blank if not available, None if the script cannot be parsed
+    """
+
+    try:
+        tree = ast.parse(Path(script_path).read_bytes(), filename=str(script_path))
+    except (OSError, SyntaxError, ValueError):
+        return None
+
+    return _get_main_docstring(tree)
+
+
+def _get_main_docstring(tree: ast.Module) -> str:
+    """
+    Returns the main method docstring of a parsed script, blank if not available.
+    """
+
+    # Only a top-level main is the script entry point, the last definition is the one in effect
+    main = None
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == "main":
+            main = node
+
+    if main is None:
+        return ""
+    return ast.get_docstring(main) or ""
+
+
+def _get_dependencies(tree: ast.Module) -> list[tuple[str, str]]:
+    """
+    Returns the third party dependencies imported by a parsed script, as (name, version) tuples.
+    """
+
+    deps = set()  # use a set to avoid duplicates
+
+    for node in _iter_imports(tree):
+        # Caso: import X, import X.y, import X.y.z
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                top = _normalize_module_name(alias.name)
+                if not _is_standard_module(top):
+                    deps.add(top)
+
+        # Caso: from X import Y
+        elif isinstance(node, ast.ImportFrom):
+            if node.module:
+                top = _normalize_module_name(node.module)
+                if not _is_standard_module(top):
+                    deps.add(top)
 
     dependencies = [(dep, "") for dep in sorted(list(deps))]
     return dependencies
 
 
-# Helpers
+def _iter_imports(tree: ast.Module) -> Iterator[Union[ast.Import, ast.ImportFrom]]:
+    """
+    Yields the import statements of a parsed script.
+    Only statements are visited: imports inside blocks (functions, classes, if, try, with, ...) are found,
+    while expressions, which can't contain an import statement, are never descended into.
+    """
+
+    stack = list(tree.body)
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            yield node
+            continue
+        for field in _BLOCK_FIELDS:
+            stack.extend(getattr(node, field, ()))
+
+
+@functools.cache
+def _get_standard_modules() -> frozenset[str]:
+    """
+    Returns the set of standard moduls to ignore. Built at the first dependency extraction, not at import.
+    """
+
+    return frozenset(sys.builtin_module_names) | frozenset(sys.stdlib_module_names)
+
 
 def _is_standard_module(module_name: str) -> bool:
     """
@@ -149,9 +312,19 @@ def _is_standard_module(module_name: str) -> bool:
     """
 
     # Check if is built-in
-    if module_name in STANDARD_MODULES:
+    if module_name in _get_standard_modules():
         return True
 
+    return _is_standard_module_spec(module_name)
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_standard_module_spec(module_name: str) -> bool:
+    """
+    Returns:
+        True if the module spec shows it is a standard module. Cached, as finding the spec searches the whole sys.path.
+    """
+
     # 2. Proviamo a trovare lo spec: se non ha "origin" o è "built-in" / "stdlib"
     try:
         spec = importlib.util.find_spec(module_name)
@@ -1,25 +1,78 @@
+import collections
+import contextlib
+import functools
+import hashlib
+import json
+import os
+import re
 import shutil
 import subprocess
 import sys
+import threading
+import uuid
+from importlib import metadata as importlib_metadata
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Iterator, Optional
 
+from rich.markup import escape
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, MofNCompleteColumn
 
-from pyscript.core.manager import VENVS_DIR
-from pyscript.utils.console import Console, console
+from pyscript.core.manager import VENVS_DIR, WHEELHOUSE_DIR
+from pyscript.utils.console import Console
+from pyscript.utils.progress import get_bar_progress
 from pyscript.utils.error import VenvError, DependenceInstallationError
 
+if TYPE_CHECKING:
+    from rich.progress import Progress, TaskID
 
-def prepare(script_name: str, dependencies: list[tuple[str, str]]) -> Optional[Path]:
+
+# File inside a virtual environment holding the hash of the dependencies installed in it
+DEPS_STAMP_FILE = ".pyscript-deps"
+
+# Virtual environments shared by the scripts with the same dependencies, named by the dependencies hash
+SHARED_DIR = VENVS_DIR / ".shared"
+
+# Directory and names of the executables inside a virtual environment
+_VENV_BIN = "Scripts" if sys.platform == "win32" else "bin"
+_PYTHON_NAME = "python.exe" if sys.platform == "win32" else "python"
+_PIP_NAME = "pip.exe" if sys.platform == "win32" else "pip"
+
+# Runs of characters equivalent in package names
+_PACKAGE_NAME_SEPARATORS = re.compile(r"[-_.]+")
+
+# Suffix of the lock files, next to the virtual environments, held while an environment is prepared
+LOCK_SUFFIX = ".lock"
+
+# Last output lines of a failed pip run shown to the user
+_PIP_OUTPUT_TAIL = 20
+
+# Infix of the virtual environments being removed in background, e.g. "script.deleting-<id>"
+DELETING_INFIX = ".deleting-"
+
+# Options added to the package commands by frontend: uv has no version check and never asks for confirmation
+_FRONTEND_OPTIONS = {
+    "pip": {"uninstall": ["-y"], "list": ["--format=json", "--disable-pip-version-check"]},
+    "uv": {"list": ["--format=json"]},
+}
+
+# Install options for dependencies known to be a closed set: no resolution, no isolated builds and no source builds
+_CLOSED_SET_OPTIONS = ["--no-deps", "--only-binary=:all:", "--no-build-isolation"]
+
+
+def prepare(
+    script_name: str,
+    dependencies: list[tuple[str, str]],
+    assume_closed: bool = False,
+) -> Optional[Path]:
     """
     Create a virtual environment for the script, if it not exists, and install the dependencies, if not installed or with an older version.
     In case no third party dependencies are needed, no virtual environment will be created.
+    The virtual environment is locked while it is prepared, so concurrent runs of the same script don't install at the same time.
 
     Arguments:
         script_name: name of the script for which the virtual environment should be created
         dependencies: list of (package, version) tuples representing the dependencies of the script
+        assume_closed: whether the dependencies include all the transitive ones, so they can be installed as they are
 
     Returns:
         The Path to the created virtual environment if needed, None otherwise.
@@ -32,41 +85,34 @@ def prepare(script_name: str, dependencies: list[tuple[str, str]]) -> Optional[P
     if not dependencies:
         return None
 
-    env_path = _ensure_env_exists(script_name)
+    # Nothing to check if the same dependencies were already installed in a working environment
+    env_path = _get_env_path(script_name)
+    deps_hash = _hash_dependencies(dependencies)
+    if _is_ready(env_path, deps_hash):
+        return env_path
 
-    max_try = 1
-    for attempt in range(max_try):
-        try:
-            _check_and_install_deps(script_name, dependencies, env_path)
-            break
-        except DependenceInstallationError:
-            raise VenvError()
-        except FileNotFoundError:
-            Console.print_error("virtual environment damaged")
-            if attempt == max_try:
-                raise VenvError()
-            recreate(script_name, dependencies)
-    return env_path
+    with _lock_env(script_name):
+        return _prepare(script_name, dependencies, assume_closed)
 
 
-def recreate(script_name: str, dependencies: list[tuple[str, str]]) -> Optional[Path]:
+def recreate(script_name: str, dependencies: list[tuple[str, str]], assume_closed: bool = False) -> Optional[Path]:
     """
     Recreate a virtual environment. Remove the ild virtual environment and create a new one.
 
     Arguments:
         script_name: script name
         dependencies: Python script dependencies
+        assume_closed: whether the dependencies include all the transitive ones, see prepare()
     """
 
-    Console.print(f"🔧 Removing virtual environment for [bold]{script_name}[/bold]...")
-    env_path = _get_env_path(script_name)
-    _remove_venv(env_path)
-    return prepare(script_name, dependencies)
+    with _lock_env(script_name):
+        return _recreate(script_name, dependencies, assume_closed)
 
 
 def delete(script_name: str) -> None:
     """
-    Remove a virtual environment.
+    Remove a virtual environment, along with its lock file.
+    A shared environment is removed only when no other script links to it, otherwise only the link of the script is.
 
     Arguments:
         script_name: name of the script whose virtual environment needs to be removed.
@@ -76,16 +122,63 @@ def delete(script_name: str) -> None:
     """
 
     path = _get_env_path(script_name)
-    if not path.exists():
+    if not (path.exists() or path.is_symlink()):
         raise FileNotFoundError()
 
     Console.print(f"🔧 Removing virtual environment for [bold]{script_name}[/bold]...")
+    shared_path = Path(os.readlink(path)) if path.is_symlink() else None
     _remove_venv(path)
+    (VENVS_DIR / f"{script_name}{LOCK_SUFFIX}").unlink(missing_ok=True)
+
+    if shared_path is not None:
+        with _lock(SHARED_DIR / f"{shared_path.name}{LOCK_SUFFIX}"):
+            if _is_linked(shared_path):
+                Console.print("   [bold yellow]⚠[/] The virtual environment is shared, it is kept for the other scripts using it.")
+            elif shared_path.exists():
+                _remove_venv(shared_path)
+
+
+def python_path(env_path: Path) -> Path:
+    """
+    Returns the path of the python executable of a virtual environment.
+
+    Arguments:
+        env_path: Path to the virtual environment.
+
+    Returns:
+        The python executable path, which may not exist.
+    """
+
+    return env_path / _VENV_BIN / _PYTHON_NAME
+
+
+def satisfied_by_host(dependencies: list[tuple[str, str]]) -> bool:
+    """
+    Check if all the dependencies are installed, with the required version, in the running interpreter,
+    in which case a script may run without a virtual environment.
+
+    Arguments:
+        dependencies: list of (package, version) tuples, an empty version accepts any version
+
+    Returns:
+        A boolean indicating if the running interpreter has all the dependencies.
+    """
+
+    for pkg, ver in dependencies:
+        try:
+            installed_version = importlib_metadata.version(pkg)
+        except importlib_metadata.PackageNotFoundError:
+            return False
+        if ver and installed_version != ver:
+            return False
+    return True
 
 
 def delete_dependencies(script_name: str, dependencies: list[str]) -> bool:
     """
     Uninstall specific dependencies in a dedicated virtual environment.
+    If the environment is shared, the script gets its own copy of it first: the shared environment
+    is left untouched for the other scripts using it.
 
     Arguments:
         script_name: The name of the script for which dependencies should be uninstalled.
@@ -96,49 +189,256 @@ def delete_dependencies(script_name: str, dependencies: list[str]) -> bool:
     """
 
     env_path = _get_env_path(script_name)
-    pip_path = _ensure_pip(env_path)
 
-    with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            MofNCompleteColumn(),
-            console=console,
-            transient=True
-    ) as progress:
+    with _lock_env(script_name):
+        if env_path.is_symlink():
+            Console.print("   [bold yellow]⚠[/] The virtual environment is shared, a copy of it is made for the script.")
+            _unshare_env(env_path)
+        return _delete_dependencies(env_path, dependencies)
+
+
+# Helpers
+
+def _delete_dependencies(env_path: Path, dependencies: list[str]) -> bool:
+    """
+    Uninstall specific dependencies from a virtual environment, see delete_dependencies().
+    """
+
+    # The installed dependencies will no longer match the stamp
+    _remove_deps_stamp(env_path)
+
+    with get_bar_progress(disable=len(dependencies) == 1) as progress:
 
         task_id = progress.add_task("Starting...", total=len(dependencies))
 
+        # Check which dependencies are installed
+        progress.update(task_id, description="[dim]Checking installed dependencies[/]...")
+        installed = _get_installed_versions(env_path)
+        to_uninstall = []
         for dep in dependencies:
-            progress.update(task_id, description=f"[dim]Uninstalling[/] [bold cyan]{dep}[/]...")
-
-            # Check if the dependency is installed
-            if not _check_installed_dependence_version(env_path, dep):
+            if _normalize_package_name(dep) not in installed:
                 Console.print(f"   [bold yellow]⚠[/] Dependency [bold]{dep}[/] not installed (skipped).")
+                progress.advance(task_id)
                 continue
+            to_uninstall.append(dep)
 
-            # Uninstall the dependency
-            try:
-                subprocess.run(
-                    [str(pip_path), "uninstall", "-y", dep],
-                    check=True,
-                    capture_output=True,
-                    text=True,
-                )
-                Console.print(f"   [green]✔[/] Uninstalled [bold]{dep}[/]")
-            except subprocess.CalledProcessError as e:
-                Console.print(Panel(
-                    f"Error uninstalling {dep}:\n{e.stderr.strip()}",
-                    title="[red]Uninstallation Failed[/]",
-                    border_style="red"
-                ))
-                raise DependenceInstallationError()
-
-            progress.advance(task_id)
+        if not to_uninstall:
+            return False
+
+        # Uninstall all the dependencies with a single run
+        progress.update(task_id, description=f"[dim]Uninstalling[/] [bold cyan]{len(to_uninstall)}[/] [dim]dependencies[/]...")
+        try:
+            _run_pip([*_pip_frontend(env_path, "uninstall"), *to_uninstall], progress, task_id)
+        except subprocess.CalledProcessError as e:
+            Console.print(Panel(
+                f"Error uninstalling {', '.join(to_uninstall)}:\n{e.output}",
+                title="[red]Uninstallation Failed[/]",
+                border_style="red"
+            ))
+            raise DependenceInstallationError()
+
+        for dep in to_uninstall:
+            Console.print(f"   [green]✔[/] Uninstalled [bold]{dep}[/]")
+        progress.advance(task_id, len(to_uninstall))
     return True
 
 
-# Helpers
+def _prepare(
+    script_name: str,
+    dependencies: list[tuple[str, str]],
+    assume_closed: bool = False,
+) -> Optional[Path]:
+    """
+    Prepare the virtual environment of a script, see prepare(). The caller must hold the environment lock.
+    Scripts with the same dependencies share a single environment, the script environment is a link to it.
+    """
+
+    if not dependencies:
+        return None
+
+    # Another process may have prepared the environment while waiting for the lock
+    env_path = _get_env_path(script_name)
+    deps_hash = _hash_dependencies(dependencies)
+    if _is_ready(env_path, deps_hash):
+        return env_path
+
+    shared_path = SHARED_DIR / deps_hash
+    if _link_env(env_path, shared_path):
+        # Different scripts may prepare the same shared environment at the same time
+        with _lock(SHARED_DIR / f"{deps_hash}{LOCK_SUFFIX}"):
+            _install_env(script_name, shared_path, dependencies, deps_hash, assume_closed)
+    else:
+        # Links are not supported, the script gets its own environment
+        _install_env(script_name, env_path, dependencies, deps_hash, assume_closed)
+    return env_path
+
+
+def _recreate(script_name: str, dependencies: list[tuple[str, str]], assume_closed: bool = False) -> Optional[Path]:
+    """
+    Recreate the virtual environment of a script, see recreate(). The caller must hold the environment lock.
+    """
+
+    Console.print(f"🔧 Removing virtual environment for [bold]{script_name}[/bold]...")
+    env_path = _get_env_path(script_name)
+
+    # A damaged shared environment is removed as well, the scripts sharing it will create it again
+    if env_path.is_symlink():
+        _remove_shared_env(env_path)
+
+    if env_path.exists() or env_path.is_symlink():
+        _remove_venv(env_path)
+    return _prepare(script_name, dependencies, assume_closed)
+
+
+def _install_env(
+    script_name: str,
+    env_path: Path,
+    dependencies: list[tuple[str, str]],
+    deps_hash: str,
+    assume_closed: bool = False,
+) -> None:
+    """
+    Create a virtual environment, if it not exists, and install the dependencies identified by the hash in it.
+
+    Raises:
+        VenvError: If the virtual environment cannot be created properly.
+    """
+
+    if _is_ready(env_path, deps_hash):
+        return
+
+    _ensure_env_exists(script_name, env_path)
+
+    try:
+        _check_and_install_deps(script_name, dependencies, env_path, assume_closed)
+    except DependenceInstallationError:
+        raise VenvError()
+    except FileNotFoundError:
+        # The environment has no pip (or python): it is created again, once
+        Console.print_error("virtual environment damaged")
+        Console.print(f"🔧 Removing virtual environment for [bold]{script_name}[/bold]...")
+        _remove_venv(env_path)
+        _ensure_env_exists(script_name, env_path)
+        try:
+            _check_and_install_deps(script_name, dependencies, env_path, assume_closed)
+        except (DependenceInstallationError, FileNotFoundError):
+            raise VenvError()
+
+    _write_deps_stamp(env_path, deps_hash)
+
+
+def _unshare_env(env_path: Path) -> None:
+    """
+    Replace the link of a script environment with a copy of the shared environment it links to.
+    The copy is made aside first, so the link is replaced only once the copy is complete.
+    """
+
+    shared_path = Path(os.readlink(env_path))
+    tmp_path = env_path.with_name(f"{env_path.name}.copy")
+    if tmp_path.exists():
+        shutil.rmtree(tmp_path)
+
+    with _lock(SHARED_DIR / f"{shared_path.name}{LOCK_SUFFIX}"):
+        shutil.copytree(shared_path, tmp_path, symlinks=True)
+    env_path.unlink()
+    os.replace(tmp_path, env_path)
+
+
+def _is_linked(shared_path: Path) -> bool:
+    """
+    Returns whether the environment of some script links to a shared environment.
+    """
+
+    with os.scandir(VENVS_DIR) as entries:
+        return any(entry.is_symlink() and Path(os.readlink(entry.path)) == shared_path for entry in entries)
+
+
+def _remove_shared_env(env_path: Path) -> None:
+    """
+    Remove the shared environment a script environment links to, keeping the link.
+    """
+
+    shared_path = Path(os.readlink(env_path))
+    with _lock(SHARED_DIR / f"{shared_path.name}{LOCK_SUFFIX}"):
+        if shared_path.exists():
+            _remove_venv(shared_path)
+
+
+def _link_env(env_path: Path, shared_path: Path) -> bool:
+    """
+    Point the virtual environment of a script to a shared environment, replacing the previous one.
+
+    Returns:
+        False if links are not supported, in which case the previous environment is kept.
+    """
+
+    if env_path.is_symlink() and Path(os.readlink(env_path)) == shared_path:
+        return True
+
+    SHARED_DIR.mkdir(parents=True, exist_ok=True)
+
+    # The link is created aside first, so the previous environment is removed only if links are supported
+    tmp_link = env_path.with_name(f"{env_path.name}.link")
+    try:
+        if tmp_link.is_symlink():
+            tmp_link.unlink()
+        os.symlink(shared_path, tmp_link, target_is_directory=True)
+    except OSError:
+        return False
+
+    if env_path.exists() and not env_path.is_symlink():
+        _remove_venv(env_path)
+    os.replace(tmp_link, env_path)
+    return True
+
+
+@contextlib.contextmanager
+def _lock_env(script_name: str) -> Iterator[None]:
+    """
+    Hold an exclusive lock on the virtual environment of a script, waiting for other processes to release it.
+    The lock is taken on a file next to the environment, as the environment itself may be removed and created again.
+    """
+
+    with _lock(VENVS_DIR / f"{script_name}{LOCK_SUFFIX}"):
+        yield
+
+
+@contextlib.contextmanager
+def _lock(lock_path: Path) -> Iterator[None]:
+    """
+    Hold an exclusive lock on a file, waiting for other processes to release it.
+    """
+
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, "wb") as lock_file:
+        if sys.platform == "win32":
+            import msvcrt
+            while True:
+                try:
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue  # LK_LOCK gives up after 10 seconds, keep waiting
+            try:
+                yield
+            finally:
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def _is_ready(env_path: Path, deps_hash: str) -> bool:
+    """
+    Returns whether the virtual environment works and has the dependencies identified by the hash installed.
+    """
+
+    return _read_deps_stamp(env_path) == deps_hash and python_path(env_path).exists()
+
 
 def _get_env_path(script_name: str) -> Path:
     """
@@ -148,63 +448,103 @@ def _get_env_path(script_name: str) -> Path:
     return VENVS_DIR / script_name
 
 
-def _ensure_env_exists(script_name: str) -> Path:
+def _ensure_env_exists(script_name: str, env_path: Path) -> Path:
     """
-    Creates a virtual environment for the script, if it not exists.
+    Creates a virtual environment for the script, if it not exists. uv is used if available, as it is much faster than venv.
+    Otherwise pip is installed in the environment only if the running interpreter has no pip able to install in it.
     """
 
-    env_path = _get_env_path(script_name)
     if not env_path.exists():
         Console.print(f"🔧 Creating virtual environment for [bold]{script_name}[/bold]...")
-        subprocess.run([sys.executable, "-m", "venv", str(env_path)], check=True)
+        uv = _find_uv()
+        if uv:
+            subprocess.run([uv, "venv", "--quiet", "--python", sys.executable, str(env_path)], check=True)
+        elif _has_host_pip():
+            # Bootstrapping pip is most of the creation time, the running interpreter pip is used instead
+            subprocess.run([sys.executable, "-Im", "venv", "--without-pip", str(env_path)], check=True)
+        else:
+            subprocess.run([sys.executable, "-Im", "venv", str(env_path)], check=True)
     return env_path
 
 
-def _install_dependencies(pip_path: Path, dependencies: list[tuple[str, str]]):
+def _install_dependencies(
+    env_path: Path,
+    dependencies: list[tuple[str, str]],
+    assume_closed: bool = False,
+):
     """
     Install dependencies in a dedicated virtual environment.
+    Dependencies known to be a closed set are first installed as they are, from wheels only,
+    falling back to a full resolution if that fails (e.g. a wheel is not available).
 
     Arguments:
-        pip_path: Path to the pip executable.
+        env_path: Path to the virtual environment.
         dependencies: The dependencies to install.
+        assume_closed: Whether the dependencies include all the transitive ones.
 
     Raises:
         InstallationError: If a dependency cannot be installed.
     """
 
-    with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            MofNCompleteColumn(),
-            console=console,
-            transient=True
-    ) as progress:
+    packages = [f"{pkg}=={ver}" if ver else pkg for pkg, ver in dependencies]
+
+    with get_bar_progress(disable=len(dependencies) == 1) as progress:
 
         task_id = progress.add_task("Starting...", total=len(dependencies))
 
-        for pkg, ver in dependencies:
-            package = f"{pkg}=={ver}" if ver else pkg
-            progress.update(task_id, description=f"[dim]Installing[/] [bold cyan]{pkg}[/]...")
+        # Install all the dependencies with a single run, so they are resolved and downloaded together
+        progress.update(task_id, description=f"[dim]Installing[/] [bold cyan]{len(packages)}[/] [dim]dependencies[/]...")
+        command = _pip_frontend(env_path, "install")
+
+        # Wheels put in the wheelhouse are installed from there, without downloading them
+        if WHEELHOUSE_DIR.is_dir():
+            command += ["--find-links", str(WHEELHOUSE_DIR)]
+        try:
             try:
-                subprocess.run(
-                    [str(pip_path), "install", package],
-                    check=True,
-                    capture_output=True,
-                    text=True,
-                )
-                Console.print(f"   [green]✔[/] Installed [bold]{package}[/]")
-            except subprocess.CalledProcessError as e:
-                Console.print(Panel(
-                    f"Error installing {package}:\n{e.stderr.strip()}",
-                    title="[red]Installation Failed[/]",
-                    border_style="red"
-                ))
-                raise DependenceInstallationError()
-            progress.advance(task_id)
+                _run_pip([*command, *(_CLOSED_SET_OPTIONS if assume_closed else []), *packages], progress, task_id)
+            except subprocess.CalledProcessError:
+                if not assume_closed:
+                    raise
+                _run_pip([*command, *packages], progress, task_id)
+        except subprocess.CalledProcessError as e:
+            Console.print(Panel(
+                f"Error installing {', '.join(packages)}:\n{e.output}",
+                title="[red]Installation Failed[/]",
+                border_style="red"
+            ))
+            raise DependenceInstallationError()
+
+        for package in packages:
+            Console.print(f"   [green]✔[/] Installed [bold]{package}[/]")
+        progress.advance(task_id, len(packages))
     return True
 
 
+def _run_pip(command: list[str], progress: "Progress", task_id: "TaskID") -> None:
+    """
+    Run a pip command, streaming its output: each line is shown as the task description while pip works.
+
+    Arguments:
+        command: The command line to run.
+        progress: The progress showing the task.
+        task_id: The task to describe.
+
+    Raises:
+        subprocess.CalledProcessError: If the command fails, with the last lines of its output.
+    """
+
+    output = collections.deque(maxlen=_PIP_OUTPUT_TAIL)
+    with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1) as process:
+        for line in process.stdout:
+            line = line.strip()
+            if line:
+                output.append(line)
+                progress.update(task_id, description=f"[dim]{escape(line[:60])}[/]")
+
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, command, output="\n".join(output))
+
+
 def _ensure_pip(env_path: Path) -> Optional[Path]:
     """
     Returns the pip executable if it exists.
@@ -216,11 +556,70 @@ def _ensure_pip(env_path: Path) -> Optional[Path]:
         The pip executable path or None.
     """
 
-    pip_path = env_path / ("Scripts" if sys.platform == "win32" else "bin") / "pip"
+    pip_path = env_path / _VENV_BIN / _PIP_NAME
     return pip_path if pip_path.exists() else None
 
 
-def _check_and_install_deps(script_name: str, dependencies: list[tuple[str, str]], env_path: Path):
+@functools.lru_cache(maxsize=1)
+def _find_uv() -> Optional[str]:
+    """
+    Returns the uv executable if it is on PATH, None otherwise.
+    """
+
+    return shutil.which("uv")
+
+
+@functools.lru_cache(maxsize=1)
+def _has_host_pip() -> bool:
+    """
+    Returns whether the running interpreter has a pip able to work on another environment (pip 22.3+, --python option).
+    """
+
+    try:
+        version = importlib_metadata.version("pip")
+        return tuple(int(part) for part in version.split(".")[:2]) >= (22, 3)
+    except (importlib_metadata.PackageNotFoundError, ValueError):
+        return False
+
+
+def _pip_frontend(env_path: Path, command: str) -> Optional[list[str]]:
+    """
+    Returns the command line running a pip command on a virtual environment.
+    uv is used if available, as it resolves and installs packages much faster, otherwise the environment pip
+    or, for environments created without it, the running interpreter pip.
+    The environment pip is run through the environment python rather than its own script,
+    whose shebang still points to the original environment in a copied one.
+
+    Arguments:
+        env_path: Path to the virtual environment.
+        command: The pip command, e.g. "install".
+
+    Returns:
+        The command line, without the packages, or None if the virtual environment has no python or pip executable.
+    """
+
+    uv = _find_uv()
+    if uv:
+        python_exec = python_path(env_path)
+        if not python_exec.exists():
+            return None
+        return [uv, "pip", command, "--python", str(python_exec), *_FRONTEND_OPTIONS["uv"].get(command, [])]
+
+    python_exec = python_path(env_path)
+    if _ensure_pip(env_path) and python_exec.exists():
+        return [str(python_exec), "-m", "pip", command, *_FRONTEND_OPTIONS["pip"].get(command, [])]
+
+    if not (_has_host_pip() and python_exec.exists()):
+        return None
+    return [sys.executable, "-m", "pip", "--python", str(python_exec), command, *_FRONTEND_OPTIONS["pip"].get(command, [])]
+
+
+def _check_and_install_deps(
+    script_name: str,
+    dependencies: list[tuple[str, str]],
+    env_path: Path,
+    assume_closed: bool = False,
+):
     """
     Checks if the dependencies are already installed and if not installs them.
 
@@ -228,17 +627,23 @@ def _check_and_install_deps(script_name: str, dependencies: list[tuple[str, str]
         script_name: Name of the script.
         dependencies: The dependencies to install.
         env_path: Path to the virtual environment.
+        assume_closed: Whether the dependencies include all the transitive ones.
 
     Raises:
-        FileNotFoundError: If the pip executable was not found.
+        FileNotFoundError: If the pip (or python, with uv) executable was not found.
         DependenceInstallationError: If a dependency cannot be installed.
     """
 
+    # Ensure the packages can be installed
+    if not _pip_frontend(env_path, "install"):
+        raise FileNotFoundError()
+
     pkg_to_ins = []
     pkg_to_upd = []
 
+    installed = _get_installed_versions(env_path)
     for pkg, ver in dependencies:
-        installed_version = _check_installed_dependence_version(env_path, pkg)
+        installed_version = installed.get(_normalize_package_name(pkg))
 
         if not installed_version:
             package_spec = (pkg, ver) if ver else (pkg, "")
@@ -249,61 +654,118 @@ def _check_and_install_deps(script_name: str, dependencies: list[tuple[str, str]
             package_spec = (pkg, ver) if ver else (pkg, "")
             pkg_to_upd.append(package_spec)
 
-    # Ensure pip executable exists
-    pip_path = _ensure_pip(env_path)
-    if not pip_path:
-        raise FileNotFoundError()
+    if not (pkg_to_ins or pkg_to_upd):
+        return
 
-    # Install missing dependencies
+    # Tell what is going to change
     if pkg_to_ins:
         count = len(pkg_to_ins)
         label = "dependency" if count == 1 else "dependencies"
-        Console.print(f"🔧 Installing {count} missing {label} for [bold]{script_name}[/]:")
-        try:
-            _install_dependencies(pip_path, pkg_to_ins)
-        except DependenceInstallationError as e:
-            raise e
-
-    # Updating old dependencies
+        Console.print(f"🔧 Installing {count} missing {label} for [bold]{script_name}[/]")
     if pkg_to_upd:
         count = len(pkg_to_upd)
         label = "dependency" if count == 1 else "dependencies"
-        Console.print(f"🔧 Updating {count} {label} for [bold]{script_name}[/]:")
-        try:
-            _install_dependencies(pip_path, pkg_to_upd)
-        except DependenceInstallationError as e:
-            raise e
+        Console.print(f"🔧 Updating {count} {label} for [bold]{script_name}[/]")
+
+    # Missing and old dependencies are installed together, so they are resolved once
+    _install_dependencies(env_path, pkg_to_ins + pkg_to_upd, assume_closed)
 
 
-def _check_installed_dependence_version(env_path, pkg) -> Optional[str]:
+def _get_installed_versions(env_path: Path) -> dict[str, str]:
     """
-    Checks the dependency version installed, if there is one.
+    Returns the versions of all the packages installed in a virtual environment, listed by a single pip run.
 
     Arguments:
         env_path: Path to the virtual environment.
-        pkg: The package to check.
 
     Returns:
-        The version installed or None.
+        The installed version by normalized package name, empty if the packages cannot be listed.
     """
 
+    frontend = _pip_frontend(env_path, "list")
+    if not frontend:
+        return {}
+
     try:
-        python_exec = env_path / ("Scripts" if sys.platform == "win32" else "bin") / "python"
-        installed_version = subprocess.run(
-            [str(python_exec), "-c", f"import importlib.metadata; print(importlib.metadata.version('{pkg}'))"],
-            capture_output=True, text=True
-        ).stdout.strip()
-    except Exception:
-        installed_version = None
-    return installed_version
+        result = subprocess.run(
+            frontend,
+            check=True, capture_output=True, text=True
+        )
+        packages = json.loads(result.stdout)
+    except (OSError, subprocess.CalledProcessError, ValueError):
+        return {}
+    return {_normalize_package_name(p["name"]): p["version"] for p in packages}
+
+
+def _normalize_package_name(name: str) -> str:
+    """
+    Returns the normalized form of a package name (PEP 503), as pip treats "Foo_Bar" and "foo-bar" as the same package.
+    """
+
+    return _PACKAGE_NAME_SEPARATORS.sub("-", name).lower()
+
+
+def _hash_dependencies(dependencies: list[tuple[str, str]]) -> str:
+    """
+    Returns a hash identifying a set of dependencies, regardless of their order.
+    Dependencies loaded from the metadata are lists, so they are normalized to tuples of strings first.
+    """
+
+    normalized = sorted((str(pkg), str(ver)) for pkg, ver in dependencies)
+    return hashlib.blake2b(json.dumps(normalized).encode(), digest_size=16).hexdigest()
+
+
+def _read_deps_stamp(env_path: Path) -> Optional[str]:
+    """
+    Returns the hash of the dependencies installed in a virtual environment, None if unknown.
+    """
+
+    try:
+        return (env_path / DEPS_STAMP_FILE).read_text()
+    except OSError:
+        return None
+
+
+def _write_deps_stamp(env_path: Path, deps_hash: str) -> None:
+    """
+    Save the hash of the dependencies installed in a virtual environment.
+    """
+
+    try:
+        (env_path / DEPS_STAMP_FILE).write_text(deps_hash)
+    except OSError:
+        pass  # The stamp is only an optimization, dependencies will be checked again
+
+
+def _remove_deps_stamp(env_path: Path) -> None:
+    """
+    Forget the dependencies installed in a virtual environment, so they will be checked again.
+    """
+
+    try:
+        (env_path / DEPS_STAMP_FILE).unlink()
+    except OSError:
+        pass
 
 
 def _remove_venv(env_path: Path):
     """
-    Remove a virtual environment.
+    Remove a virtual environment. A link to a shared environment is removed, leaving the shared environment.
+    The environment is moved aside and deleted in background, so a new one can be created in its place meanwhile.
+    The deletion is completed before the program exits, if interrupted "pyscript clean" removes what is left.
 
     Arguments:
         env_path: Path to the virtual environment.
     """
 
-    shutil.rmtree(env_path)
\ No newline at end of file
+    if env_path.is_symlink():
+        env_path.unlink()
+        return
+
+    deleting_path = env_path.with_name(f"{env_path.name}{DELETING_INFIX}{uuid.uuid4().hex}")
+    try:
+        os.rename(env_path, deleting_path)
+    except OSError:
+        shutil.rmtree(env_path)  # The environment cannot be moved, e.g. it is in use on Windows
+        return
+    threading.Thread(target=shutil.rmtree, args=(deleting_path,), kwargs={"ignore_errors": True}).start()
\ No newline at end of file
@@ -5,6 +5,11 @@ from typing import Optional
 # rich.console.Console instance
 console = RichConsole()
 
+# Prefixes of the error, warning and success messages
+ERROR_PREFIX = "❌ [red]Error:[/red] "
+WARNING_PREFIX = "⚠️  [yellow]Warning:[/yellow] "
+SUCCESS_PREFIX = "✅ "
+
 
 class Console:
     """
@@ -24,7 +29,7 @@ class Console:
         Display an error message with the form: "❌ [red]Error:[/red] {msg}." + [" {desc}"]
         """
 
-        string = f"❌ [red]Error:[/red] {msg}." + ((" " + desc) if desc else "")
+        string = ERROR_PREFIX + msg + (". " + desc if desc else ".")
         cls.print(string)
 
     @classmethod
@@ -33,7 +38,7 @@ class Console:
         Display a warning message with the form: "⚠️  [yellow]Warning:[/yellow] {msg}." + [" {desc}"]
         """
 
-        string = f"⚠️  [yellow]Warning:[/yellow] {msg}." + ((" " + desc) if desc else "")
+        string = WARNING_PREFIX + msg + (". " + desc if desc else ".")
         cls.print(string)
 
     @classmethod
@@ -42,7 +47,7 @@ class Console:
         Display a success message with the form: "✅ {msg}"
         """
 
-        string = f"✅ {msg}"
+        string = SUCCESS_PREFIX + msg
         cls.print(string)
 
     @classmethod
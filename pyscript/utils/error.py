@@ -2,4 +2,10 @@ class VenvError(Exception):
     pass
 
 class DependenceInstallationError(Exception):
-    pass
\ No newline at end of file
+    pass
+
+class NotModified(Exception):
+    pass
+
+class GitHubError(Exception):
+    pass
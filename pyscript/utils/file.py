@@ -1,5 +1,14 @@
+import functools
 import json
+import os
+import shutil
 from pathlib import Path
+from typing import Union
+
+try:
+    import orjson
+except ImportError:  # optional speedup, the standard json module is used instead
+    orjson = None
 
 
 def get_text(path: Path) -> str:
@@ -19,6 +28,8 @@ def get_text(path: Path) -> str:
 def get_json(path: Path) -> dict:
     """
     Return a dictionary of the content of a json file.
+    The file is read from disk again only if it changed since the last read, while a new dictionary is parsed
+    at each call, so callers can freely modify it.
 
     Arguments:
         path: Path to the json file
@@ -26,20 +37,71 @@ def get_json(path: Path) -> dict:
     Returns:
         dict: Content of the json file
 
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        JSONDecodeError: If the content is malformed.
+    """
+
+    stat = os.stat(path)
+    return loads_json(_read_bytes(str(path), stat.st_mtime_ns, stat.st_size))
+
+
+def loads_json(content: Union[bytes, str]) -> dict:
+    """
+    Return a dictionary of a json document, parsed with orjson if available.
+
+    Arguments:
+        content: The json document
+
+    Returns:
+        dict: Content of the json document
+
     Raises:
         JSONDecodeError: If the content is malformed.
     """
 
-    return json.loads(get_text(path))
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def write_json(path: Path, data: dict) -> None:
+    """
+    Write a dictionary to a json file, indented to keep it readable, serialized with orjson if available.
+    Both serializers write the same layout: two spaces indentation and UTF-8 text.
+
+    Arguments:
+        path: Path to the json file
+        data: Dictionary to write
+    """
+
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        Path(path).write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    # The file may be rewritten within the timestamp resolution, with the same size
+    _read_bytes.cache_clear()
 
 
 def copy(source_path: Path, destination_path: Path) -> None:
     """
-    Copy a file from source_path to destination_path.
+    Copy a file from source_path to destination_path, byte for byte (the content is not decoded).
 
     Arguments:
         source_path: Path to the source file
         destination_path: Path to the destination file
     """
 
-    destination_path.write_text(get_text(source_path))
\ No newline at end of file
+    shutil.copyfile(source_path, destination_path)
+
+
+# Helpers
+
+@functools.lru_cache(maxsize=512)
+def _read_bytes(path: str, mtime_ns: int, size: int) -> bytes:
+    """
+    Returns the content of a file, cached by path, modification time and size.
+    """
+
+    return Path(path).read_bytes()
\ No newline at end of file
@@ -1,29 +1,62 @@
+import functools
+import hashlib
 import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
-import requests
+from pyscript.core.manager import CACHE_DIR
+from pyscript.utils.error import GitHubError, NotModified
+from pyscript.utils import file
+
+# requests takes long to import, it is loaded only when GitHub is contacted
+if TYPE_CHECKING:
+    import requests
 
 
 # pyscript-hub repository base url
 REPO_BASE_URL = "https://raw.githubusercontent.com/pyscript-hub/pyscript-hub/main"
 
+# Seconds to wait for GitHub before giving up a request
+REQUEST_TIMEOUT = 10
+
+# Connections kept open to GitHub, enough for the concurrent downloads and updates
+POOL_SIZE = 16
+
+# Retries of a request failed because of a connection error or a temporary GitHub error
+MAX_RETRIES = 2
+
+# User agent sent to GitHub
+USER_AGENT = "pyscript-hub"
 
-def load_script_metadata(script_name: str) -> dict:
+# Local copy of the files downloaded from the repository, revalidated with their ETag or Last-Modified date
+GITHUB_CACHE_DIR = CACHE_DIR / "github"
+
+
+def load_script_metadata(script_name: str, etag: Optional[str] = None) -> dict:
     """
     Load a script metadata from the official repository.
+    The ETag of the metadata is saved in it, under "_etag", to later check whether it changed.
 
     Arguments:
         script_name: the name of the script to load metadata from
+        etag: the ETag of the metadata already installed, if known
 
     Returns:
         a dictionary of the script metadata
 
     Raises:
         FileNotFoundError: if the file on the repository was not found
+        GitHubError: if GitHub cannot be reached
+        NotModified: if the metadata on the repository still has the given ETag
     """
 
     metadata_path = f"metadata/{script_name}.json"
-    content = _fetch_from_repo(metadata_path)
-    return json.loads(content)
+    content, new_etag = _fetch_from_repo(metadata_path, etag)
+    metadata = file.loads_json(content)
+    if new_etag:
+        metadata["_etag"] = new_etag
+    return metadata
 
 
 def load_script_file(script_name: str) -> str:
@@ -38,47 +71,191 @@ def load_script_file(script_name: str) -> str:
 
     Raises:
         FileNotFoundError: if the file on the repository was not found
+        GitHubError: if GitHub cannot be reached
     """
 
     script_path = f"scripts/{script_name}.py"
-    content = _fetch_from_repo(script_path)
+    content, _ = _fetch_from_repo(script_path)
     return content
 
 
+def load_script_bundle(script_name: str) -> Optional[tuple[dict, str]]:
+    """
+    Load a script metadata and file from the official repository, both at the same time.
+
+    Arguments:
+        script_name: the name of the script to load
+
+    Returns:
+        the script metadata and the content of the script file, or None if the script is not on the repository
+
+    Raises:
+        FileNotFoundError: if the script file on the repository was not found
+        GitHubError: if GitHub cannot be reached
+    """
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        metadata_future = pool.submit(load_script_metadata, script_name)
+        file_future = pool.submit(load_script_file, script_name)
+
+        # A script without metadata is not on the repository, whatever happened to its file
+        try:
+            metadata = metadata_future.result()
+        except FileNotFoundError:
+            return None
+        return metadata, file_future.result()
+
+
+@functools.lru_cache(maxsize=1)
 def load_categories() -> dict:
     """
-    Load categories from the official repository.
+    Load categories from the official repository. The result is kept for the whole execution.
+    The categories are only listed, so the local copy is used if GitHub cannot be reached.
 
     Returns:
         A dictionary of the categories with a list of the relative scripts.
 
     Raises:
         FileNotFoundError: if the file on the repository was not found.
+        GitHubError: if GitHub cannot be reached.
     """
 
     categories_path = "categories.json"
-    content = _fetch_from_repo(categories_path)
-    return json.loads(content)
+    content, _ = _fetch_from_repo(categories_path, allow_stale=True)
+    return file.loads_json(content)
 
 
 # Helpers
 
-def _fetch_from_repo(path: str) -> str:
+def _fetch_from_repo(
+    path: str,
+    if_none_match: Optional[str] = None,
+    allow_stale: bool = False,
+) -> tuple[str, Optional[str]]:
     """
     Download a file from the official repository on GitHub.
+    A local copy is kept and sent back when GitHub reports that the file is unchanged (304 Not Modified).
+    The local copy is never sent back unchecked, unless allowed: a stale file saved along with fresh metadata
+    would be taken as up-to-date from then on.
 
     Arguments:
         path: the path of the file to download
+        if_none_match: an ETag of the file the caller already has, to be told if the file still has it
+        allow_stale: whether to send back the local copy if GitHub cannot be reached (for read only callers)
 
     Returns:
-        The content of the file
+        The content of the file and its ETag
 
     Raises:
         FileNotFoundError: if the file on the repository was not found
+        NotModified: if the file still has the ETag given by the caller
+        GitHubError: if GitHub cannot be reached or answers with an error (and no local copy is allowed)
     """
 
+    import requests
+
     url = f"{REPO_BASE_URL}/{path}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise FileNotFoundError(f"File on GitHub not found: {url}")
-    return response.text
\ No newline at end of file
+    cached, etag, last_modified = _read_cache(path)
+
+    # Ask GitHub to send the file only if it changed since the caller or the cache got it
+    headers = {}
+    if if_none_match:
+        headers["If-None-Match"] = if_none_match
+    elif cached is not None:
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    try:
+        response = _get_session().get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+        if response.status_code == 404:
+            raise FileNotFoundError(f"File on GitHub not found: {url}")
+        if response.status_code != 304:
+            response.raise_for_status()
+    except requests.RequestException as e:
+        if allow_stale and cached is not None:
+            return cached, etag
+        raise GitHubError(f"GitHub request failed: {e}") from e
+
+    if response.status_code == 304:
+        if if_none_match:
+            raise NotModified(path)
+        return cached, etag
+
+    new_etag = response.headers.get("ETag")
+    _write_cache(path, response.text, new_etag, response.headers.get("Last-Modified"))
+    return response.text, new_etag
+
+
+@functools.lru_cache(maxsize=1)
+def _get_session() -> "requests.Session":
+    """
+    Returns the session shared by all the requests to GitHub, so connections are reused instead of opening one per file.
+    Requests failed because of a connection error or a temporary GitHub error are retried on the same pool.
+    """
+
+    import requests
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.headers["User-Agent"] = USER_AGENT
+    retries = Retry(total=MAX_RETRIES, backoff_factor=0.2, status_forcelist=(500, 502, 503, 504))
+    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE, max_retries=retries)
+    session.mount("https://", adapter)
+    return session
+
+
+def _get_cache_path(path: str) -> Path:
+    """
+    Returns the path of the local copy of a repository file.
+    The copy is named after a hash of the file url, so any path maps to a single safe file name in the cache.
+    """
+
+    digest = hashlib.blake2b(f"{REPO_BASE_URL}/{path}".encode(), digest_size=16).hexdigest()
+    return GITHUB_CACHE_DIR / digest
+
+
+def _read_cache(path: str) -> tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    Read the local copy of a repository file and the validators GitHub sent with it.
+
+    Arguments:
+        path: the path of the file on the repository
+
+    Returns:
+        The cached content, its ETag and its Last-Modified date, or (None, None, None) if the file was never cached
+    """
+
+    cache_path = _get_cache_path(path)
+    meta_path = cache_path.with_suffix(".meta")
+    try:
+        meta = file.loads_json(meta_path.read_bytes())
+        return cache_path.read_text(), meta.get("etag"), meta.get("last_modified")
+    except (OSError, ValueError, AttributeError):
+        return None, None, None
+
+
+def _write_cache(path: str, content: str, etag: Optional[str], last_modified: Optional[str]) -> None:
+    """
+    Save the local copy of a repository file.
+    Files without an ETag or a Last-Modified date are not cached, since they cannot be revalidated.
+
+    Arguments:
+        path: the path of the file on the repository
+        content: the content of the file
+        etag: the ETag sent by GitHub
+        last_modified: the Last-Modified date sent by GitHub
+    """
+
+    if not etag and not last_modified:
+        return
+
+    cache_path = _get_cache_path(path)
+    meta_path = cache_path.with_suffix(".meta")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(content)
+        meta_path.write_text(json.dumps({"etag": etag, "last_modified": last_modified}))
+    except OSError:
+        pass  # The cache is only an optimization
\ No newline at end of file
@@ -1,3 +1,7 @@
+# Blank characters replaced in the script names
+_BLANKS_TABLE = str.maketrans({" ": "-", "\t": "-", "\n": "-", "\r": "-"})
+
+
 def parse_script_name(script_name: str) -> str:
     """
     Parse the script name replacing blank characters with dashes.
@@ -9,4 +13,4 @@ def parse_script_name(script_name: str) -> str:
         The parsed script name
     """
 
-    return script_name.replace(" ", "-")
\ No newline at end of file
+    return script_name.translate(_BLANKS_TABLE)
\ No newline at end of file
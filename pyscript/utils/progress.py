@@ -0,0 +1,32 @@
+from typing import TYPE_CHECKING
+
+from pyscript.utils.console import console
+
+# rich.progress is loaded only when a progress bar is shown
+if TYPE_CHECKING:
+    from rich.progress import Progress
+
+
+def get_bar_progress(spinner: bool = True, disable: bool = False) -> "Progress":
+    """
+    Returns a new transient progress bar, showing the task description and the number of completed steps.
+    The bar is redrawn 4 times per second, instead of the default 10.
+
+    Arguments:
+        spinner: whether to show a spinner before the description.
+        disable: whether to disable the display (e.g. when there is a single step, rendering it costs more than it shows).
+
+    Returns:
+        A new progress object.
+    """
+
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, MofNCompleteColumn
+
+    columns = [SpinnerColumn()] if spinner else []
+    columns += [
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+    ]
+    # Descriptions change at each line of pip output, a few redraws per second are enough to follow them
+    return Progress(*columns, console=console, transient=True, disable=disable, refresh_per_second=4)